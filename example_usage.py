@@ -13,6 +13,7 @@ sys.path.insert(0, str(project_dir))
 
 from linkedin_job_mcp.linkedin_scraper import search_linkedin_jobs
 from linkedin_job_mcp.sheets_client import GoogleSheetsClient, add_jobs_to_sheets
+from linkedin_job_mcp.utils import RequirementMatcher
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -31,21 +32,21 @@ async def example_job_search():
             max_jobs=5  # Small number for testing
         )
         
-        logger.info(f"Found {len(jobs)} jobs")
+        logger.info("Found %d jobs", len(jobs))
         
         for i, job in enumerate(jobs, 1):
-            logger.info(f"\n{i}. {job['title']} at {job['company']}")
-            logger.info(f"   Location: {job['location']}")
-            logger.info(f"   URL: {job['job_url']}")
+            logger.info("\n%d. %s at %s", i, job['title'], job['company'])
+            logger.info("   Location: %s", job['location'])
+            logger.info("   URL: %s", job['job_url'])
             if job.get('match_score'):
-                logger.info(f"   Match Score: {job['match_score']:.1%}")
+                logger.info("   Match Score: %.1f%%", job['match_score'] * 100)
             if job.get('matches'):
-                logger.info(f"   Matches: {', '.join(job['matches'])}")
+                logger.info("   Matches: %s", ', '.join(job['matches']))
         
         return jobs
         
     except Exception as e:
-        logger.error(f"Error in job search: {e}")
+        logger.error("Error in job search: %s", e)
         return []
 
 
@@ -58,13 +59,13 @@ async def example_create_spreadsheet():
         spreadsheet_id = client.create_spreadsheet("LinkedIn Jobs - Example")
         
         info = client.get_spreadsheet_info(spreadsheet_id)
-        logger.info(f"Created spreadsheet: {info['title']}")
-        logger.info(f"URL: {info['url']}")
+        logger.info("Created spreadsheet: %s", info['title'])
+        logger.info("URL: %s", info['url'])
         
         return spreadsheet_id
         
     except Exception as e:
-        logger.error(f"Error creating spreadsheet: {e}")
+        logger.error("Error creating spreadsheet: %s", e)
         return None
 
 
@@ -80,15 +81,15 @@ async def example_add_jobs_to_sheets(jobs, spreadsheet_id):
         )
         
         if result['success']:
-            logger.info(f"Successfully added {result['jobs_added']} jobs")
-            logger.info(f"Spreadsheet URL: {result.get('spreadsheet_url', 'N/A')}")
+            logger.info("Successfully added %d jobs", result['jobs_added'])
+            logger.info("Spreadsheet URL: %s", result.get('spreadsheet_url', 'N/A'))
         else:
-            logger.error(f"Failed to add jobs: {result.get('error', 'Unknown error')}")
+            logger.error("Failed to add jobs: %s", result.get('error', 'Unknown error'))
         
         return result
         
     except Exception as e:
-        logger.error(f"Error adding jobs to sheets: {e}")
+        logger.error("Error adding jobs to sheets: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -119,9 +120,9 @@ async def example_full_workflow():
     
     if result['success']:
         logger.info("\n🎉 Complete workflow successful!")
-        logger.info(f"Jobs found: {len(jobs)}")
-        logger.info(f"Jobs added: {result['jobs_added']}")
-        logger.info(f"Spreadsheet: {result.get('spreadsheet_url', 'N/A')}")
+        logger.info("Jobs found: %d", len(jobs))
+        logger.info("Jobs added: %d", result['jobs_added'])
+        logger.info("Spreadsheet: %s", result.get('spreadsheet_url', 'N/A'))
     else:
         logger.error("\n❌ Workflow failed at spreadsheet step")
 
@@ -141,16 +142,17 @@ async def example_job_matching():
     
     requirements = ["Python", "Django", "REST API", "PostgreSQL", "AWS", "React"]
     
-    # Simulate matching logic
-    job_text = f"{sample_job['title']} {sample_job['description']}".lower()
-    matches = [req for req in requirements if req.lower() in job_text]
-    match_score = len(matches) / len(requirements)
+    # Build the matcher once; it can be reused for every job in a search
+    matcher = RequirementMatcher(requirements)
+    match_info = matcher.match(f"{sample_job['title']} {sample_job['description']}")
+    matches = match_info["matches"]
+    match_score = match_info["match_score"]
     
-    logger.info(f"Job: {sample_job['title']} at {sample_job['company']}")
-    logger.info(f"Requirements: {', '.join(requirements)}")
-    logger.info(f"Matches: {', '.join(matches)}")
-    logger.info(f"Match Score: {match_score:.1%}")
-    logger.info(f"Is Match: {'Yes' if match_score >= 0.5 else 'No'}")
+    logger.info("Job: %s at %s", sample_job['title'], sample_job['company'])
+    logger.info("Requirements: %s", ', '.join(requirements))
+    logger.info("Matches: %s", ', '.join(matches))
+    logger.info("Match Score: %.1f%%", match_score * 100)
+    logger.info("Is Match: %s", 'Yes' if match_score >= 0.5 else 'No')
 
 
 def example_mcp_tool_call():
@@ -168,7 +170,8 @@ def example_mcp_tool_call():
     }
     
     logger.info("Tool: search_linkedin_jobs")
-    logger.info(f"Arguments: {json.dumps(tool_args, indent=2)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Arguments: %s", json.dumps(tool_args, indent=2))
     
     # This would normally be handled by the MCP server
     logger.info("This would trigger a LinkedIn job search with the specified parameters")
@@ -211,7 +214,7 @@ async def main():
         logger.info("2. Chrome browser installed")
         logger.info("3. Stable internet connection")
     else:
-        logger.error(f"Unknown example: {example}")
+        logger.error("Unknown example: %s", example)
 
 
 if __name__ == "__main__":
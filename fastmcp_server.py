@@ -3,11 +3,17 @@
 
 import asyncio
 import logging
-import json
-from typing import List, Optional, Dict, Any
+import orjson
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple
 from fastmcp import FastMCP
-from linkedin_job_mcp.linkedin_scraper_fallback import search_linkedin_jobs
-from linkedin_job_mcp.sheets_client import add_jobs_to_sheets, GoogleSheetsClient
+from linkedin_job_mcp.linkedin_scraper import close_http_client, get_http_client, driver_pool
+from linkedin_job_mcp.linkedin_scraper_fallback import stream_linkedin_jobs
+from linkedin_job_mcp.sheets_client import (
+    add_jobs_to_sheets, flush_all_pending_appends, get_sheets_client, preload_existing_jobs,
+    spreadsheet_url, warm_up_sheets_client
+)
 from linkedin_job_mcp.config import config
 
 # Set up logging
@@ -17,8 +23,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm shared clients on startup; flush buffered rows and release them on shutdown."""
+    get_http_client()
+    await warm_up_sheets_client()
+    
+    try:
+        yield
+    finally:
+        await flush_all_pending_appends()
+        await close_http_client()
+        await driver_pool.close()
+        get_sheets_client.cache_clear()
+
 # Initialize FastMCP server
-mcp = FastMCP("linkedin-job-search")
+mcp = FastMCP("linkedin-job-search", lifespan=lifespan)
+
+# Number of scraped jobs appended to Google Sheets per API call
+SHEETS_BATCH_SIZE = 50
+
+@dataclass
+class SearchSummary:
+    """Summary block of a job search response, serialized natively by orjson."""
+    keywords: str
+    location: str
+    requirements: List[str]
+    jobs_found: int = 0
+    matching_jobs: int = 0
+
+async def _encode_jobs(jobs_stream, queue: Optional[asyncio.Queue] = None) -> Tuple[List[bytes], int]:
+    """Encode scraped jobs as they arrive, optionally forwarding each one to the Sheets writer."""
+    fragments = []
+    matching_jobs = 0
+    try:
+        async for job in jobs_stream:
+            fragments.append(orjson.dumps(job))
+            if job.get('is_match', True):
+                matching_jobs += 1
+            if queue is not None:
+                await queue.put(job)
+    finally:
+        if queue is not None:
+            await queue.put(None)
+    return fragments, matching_jobs
+
+async def _sheets_consumer(queue: asyncio.Queue, spreadsheet_id: str,
+                           filter_duplicates: bool,
+                           preload: Optional[asyncio.Task] = None) -> Dict[str, Any]:
+    """Append jobs from the queue to Google Sheets in batches as they arrive."""
+    result = {"success": True, "jobs_added": 0}
+    batch = []
+    
+    async def flush():
+        if not batch:
+            return
+        try:
+            if preload is not None:
+                # Wait for the existing rows so they are not read a second time
+                await preload
+            batch_result = await add_jobs_to_sheets(
+                jobs=list(batch),
+                spreadsheet_id=spreadsheet_id,
+                filter_duplicates=filter_duplicates
+            )
+        except Exception as e:
+            logger.error("Error adding jobs to sheets: %s", e)
+            batch_result = {"success": False, "error": str(e)}
+        batch.clear()
+        
+        result["jobs_added"] += batch_result.get("jobs_added", 0)
+        if batch_result.get("spreadsheet_url"):
+            result["spreadsheet_url"] = batch_result["spreadsheet_url"]
+        if not batch_result["success"]:
+            result["success"] = False
+            result["error"] = batch_result.get("error")
+    
+    while True:
+        job = await queue.get()
+        if job is None:
+            break
+        batch.append(job)
+        if len(batch) >= SHEETS_BATCH_SIZE:
+            await flush()
+    await flush()
+    
+    if result["success"]:
+        result["message"] = f"Successfully added {result['jobs_added']} jobs to spreadsheet"
+    else:
+        result["message"] = f"Failed to add jobs to spreadsheet: {result['error']}"
+    return result
 
 @mcp.tool()
 async def search_linkedin_jobs_tool(
@@ -30,7 +124,8 @@ async def search_linkedin_jobs_tool(
     employment_type: str = "",
     date_posted: str = "",
     spreadsheet_id: Optional[str] = None,
-    filter_duplicates: bool = True
+    filter_duplicates: bool = True,
+    detail_concurrency: Optional[int] = None
 ) -> str:
     """
     Search for jobs on LinkedIn and optionally add them to Google Sheets.
@@ -45,6 +140,7 @@ async def search_linkedin_jobs_tool(
         date_posted: Date posted filter (past 24 hours, past week, past month)
         spreadsheet_id: Google Spreadsheet ID to add jobs to (optional)
         filter_duplicates: Filter out duplicate jobs already in spreadsheet
+        detail_concurrency: Maximum number of job pages fetched concurrently (default: from config)
     
     Returns:
         JSON string with search results and summary
@@ -53,70 +149,69 @@ async def search_linkedin_jobs_tool(
         if requirements is None:
             requirements = []
             
-        logger.info(f"Searching LinkedIn jobs: {keywords} in {location}")
+        logger.info("Searching LinkedIn jobs: %s in %s", keywords, location)
         
-        # Use the existing event loop
-        jobs = await search_linkedin_jobs(
+        jobs_stream = stream_linkedin_jobs(
             keywords=keywords,
             location=location,
             requirements=requirements,
             max_jobs=max_jobs,
             experience_level=experience_level,
             employment_type=employment_type,
-            date_posted=date_posted
+            date_posted=date_posted,
+            detail_concurrency=detail_concurrency
         )
         
-        if not jobs:
-            return json.dumps({
+        sheets_result = None
+        if spreadsheet_id:
+            # Append to Google Sheets while the scrape is still producing jobs
+            logger.info("Adding jobs to Google Sheets: %s", spreadsheet_id)
+            queue = asyncio.Queue(maxsize=SHEETS_BATCH_SIZE * 2)
+            # Read the existing rows for duplicate filtering while the scrape runs
+            preload = asyncio.create_task(preload_existing_jobs(spreadsheet_id)) if filter_duplicates else None
+            (fragments, matching_jobs), sheets_result = await asyncio.gather(
+                _encode_jobs(jobs_stream, queue),
+                _sheets_consumer(queue, spreadsheet_id, filter_duplicates, preload)
+            )
+        else:
+            fragments, matching_jobs = await _encode_jobs(jobs_stream)
+        
+        if not fragments:
+            return orjson.dumps({
                 "status": "success",
                 "message": "No jobs found matching your criteria.",
-                "search_summary": {
-                    "keywords": keywords,
-                    "location": location,
-                    "requirements": requirements,
-                    "jobs_found": 0,
-                    "matching_jobs": 0
-                },
+                "search_summary": SearchSummary(keywords, location, requirements),
                 "jobs": []
-            })
+            }).decode()
         
-        # Prepare response
-        response_data = {
-            "status": "success",
-            "search_summary": {
-                "keywords": keywords,
-                "location": location,
-                "requirements": requirements,
-                "jobs_found": len(jobs),
-                "matching_jobs": len([job for job in jobs if job.get('is_match', True)])
-            },
-            "jobs": jobs
-        }
-        
-        # Add to Google Sheets if spreadsheet_id is provided
-        if spreadsheet_id:
-            try:
-                logger.info(f"Adding jobs to Google Sheets: {spreadsheet_id}")
-                
-                sheets_result = await add_jobs_to_sheets(
-                    jobs=jobs,
-                    spreadsheet_id=spreadsheet_id,
-                    filter_duplicates=filter_duplicates
-                )
-                response_data["sheets_result"] = sheets_result
-                    
-            except Exception as e:
-                logger.error(f"Error adding jobs to sheets: {e}")
-                response_data["sheets_error"] = str(e)
+        # Assemble the response around the already-encoded jobs
+        search_summary = SearchSummary(
+            keywords=keywords,
+            location=location,
+            requirements=requirements,
+            jobs_found=len(fragments),
+            matching_jobs=matching_jobs
+        )
+        parts = [
+            b'{"status":"success","search_summary":',
+            orjson.dumps(search_summary),
+            b',"jobs":[',
+            b','.join(fragments),
+            b']'
+        ]
+        if sheets_result is not None:
+            parts.append(b',"sheets_result":')
+            parts.append(orjson.dumps(sheets_result))
+        parts.append(b'}')
         
-        return json.dumps(response_data, indent=2)
+        return b''.join(parts).decode()
         
     except Exception as e:
-        logger.error(f"Error in search_linkedin_jobs_tool: {e}")
-        return json.dumps({
+        logger.error("Error in search_linkedin_jobs_tool: %s", e)
+        return orjson.dumps({
             "status": "error",
             "message": f"Error searching for jobs: {str(e)}"
-        })
+        }).decode()
 
 @mcp.tool()
 async def create_job_spreadsheet(title: str) -> str:
@@ -130,27 +225,30 @@ async def create_job_spreadsheet(title: str) -> str:
         JSON string with spreadsheet information
     """
     try:
-        logger.info(f"Creating new spreadsheet: {title}")
+        logger.info("Creating new spreadsheet: %s", title)
         
-        sheets_client = GoogleSheetsClient()
-        spreadsheet = await sheets_client.create_job_spreadsheet(title)
+        sheets_client = get_sheets_client()
+        loop = asyncio.get_running_loop()
+        spreadsheet_id = await loop.run_in_executor(
+            None, sheets_client.create_spreadsheet, title
+        )
         
-        return json.dumps({
+        return orjson.dumps({
             "status": "success",
             "message": f"Created spreadsheet '{title}' successfully",
             "spreadsheet": {
-                "id": spreadsheet["spreadsheetId"],
+                "id": spreadsheet_id,
                 "title": title,
-                "url": f"https://docs.google.com/spreadsheets/d/{spreadsheet['spreadsheetId']}"
+                "url": spreadsheet_url(spreadsheet_id)
             }
-        }, indent=2)
+        }).decode()
         
     except Exception as e:
-        logger.error(f"Error creating spreadsheet: {e}")
-        return json.dumps({
+        logger.error("Error creating spreadsheet: %s", e)
+        return orjson.dumps({
             "status": "error",
             "message": f"Error creating spreadsheet: {str(e)}"
-        })
+        }).decode()
 
 @mcp.tool()
 async def get_spreadsheet_info(spreadsheet_id: str) -> str:
@@ -164,22 +262,25 @@ async def get_spreadsheet_info(spreadsheet_id: str) -> str:
         JSON string with spreadsheet information
     """
     try:
-        logger.info(f"Getting spreadsheet info: {spreadsheet_id}")
+        logger.info("Getting spreadsheet info: %s", spreadsheet_id)
         
-        sheets_client = GoogleSheetsClient()
-        info = await sheets_client.get_spreadsheet_info(spreadsheet_id)
+        sheets_client = get_sheets_client()
+        loop = asyncio.get_running_loop()
+        info = await loop.run_in_executor(
+            None, sheets_client.get_spreadsheet_info, spreadsheet_id
+        )
         
-        return json.dumps({
+        return orjson.dumps({
             "status": "success",
             "spreadsheet": info
-        }, indent=2)
+        }).decode()
         
     except Exception as e:
-        logger.error(f"Error getting spreadsheet info: {e}")
-        return json.dumps({
+        logger.error("Error getting spreadsheet info: %s", e)
+        return orjson.dumps({
             "status": "error",
             "message": f"Error getting spreadsheet info: {str(e)}"
-        })
+        }).decode()
 
 # Add health check endpoint for TrueFoundry
 @mcp.custom_route("/health", methods=["GET"])
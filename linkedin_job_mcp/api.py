@@ -1,35 +1,169 @@
 """FastAPI wrapper for LinkedIn Job MCP Server."""
 
 import asyncio
+import hashlib
+import importlib.util
 import logging
+import math
+import os
+import re
+import sys
+import time
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import traceback
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Body
+import orjson
+from cachetools import TTLCache
+
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Query, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.datastructures import Headers
 import uvicorn
 from pathlib import Path
 
-from .linkedin_scraper import search_linkedin_jobs
-from .sheets_client import add_jobs_to_sheets, GoogleSheetsClient
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+from .linkedin_scraper import (
+    search_linkedin_jobs,
+    stream_linkedin_jobs,
+    driver_pool,
+    get_chromedriver_path,
+    close_http_client
+)
+from .sheets_client import add_jobs_to_sheets, flush_all_pending_appends, get_sheets_client, spreadsheet_url
 from .config import config
+from .tasks import run_job_search, search_jobs_task, get_celery_task_status, create_task_store
+from .rate_limit import create_rate_limiter
 from .utils import setup_logging, create_error_response, create_success_response
 from .linkedin_oauth import (
     get_linkedin_oauth_client, 
     get_linkedin_api_client,
+    create_oauth_state_store,
+    close_linkedin_oauth_client,
+    verify_oauth_state,
     LinkedInOAuthError
 )
 
 # Set up logging
-setup_logging()
+setup_logging(config.log_level)
 logger = logging.getLogger(__name__)
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# Asset names carrying a content hash (e.g. app.3f2a9c1d.js) never change in place
+_FINGERPRINTED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.")
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli when the client accepts it, otherwise gzip.
+    
+    Paths starting with one of ``exclude_paths``, and requests that accept one of
+    ``exclude_media_types``, are left uncompressed.
+    """
+
+    def __init__(self, app, exclude_paths: tuple = (), exclude_media_types: tuple = (),
+                 minimum_size: int = 1024, compresslevel: int = 5, brotli_quality: int = 4):
+        self.app = app
+        self.exclude_paths = exclude_paths
+        self.exclude_media_types = exclude_media_types
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.brotli = None
+        if BrotliMiddleware is not None:
+            self.brotli = BrotliMiddleware(
+                app, quality=brotli_quality, minimum_size=minimum_size, gzip_fallback=False
+            )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        accept = headers.get("accept", "")
+        if any(media_type in accept for media_type in self.exclude_media_types):
+            await self.app(scope, receive, send)
+            return
+        if self.brotli is not None:
+            accept_encoding = headers.get("accept-encoding", "")
+            if "br" in {encoding.split(";")[0].strip() for encoding in accept_encoding.split(",")}:
+                await self.brotli(scope, receive, send)
+                return
+        await self.gzip(scope, receive, send)
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files served with Cache-Control headers."""
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _FINGERPRINTED_ASSET.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=300"
+        return response
+
+
+# How often the /health service probes are re-run in the background
+HEALTH_REFRESH_SECONDS = 60
+
+# How often expired OAuth tokens are dropped in the background
+TOKEN_EXPIRY_SWEEP_SECONDS = 300
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Probe services and start browsers at startup; release them on shutdown."""
+    _snapshot_config()
+    # Probing installs chromedriver, which can take a while, so it never holds up startup
+    refresh_task = asyncio.create_task(_refresh_health_loop())
+    startup_tasks = [refresh_task]
+    if config.web_concurrency <= 1:
+        # Chrome takes seconds to start, so warm the driver pool without delaying startup.
+        # With several workers each would start a full pool at boot; they start drivers on demand.
+        startup_tasks.append(asyncio.create_task(driver_pool.warm_up()))
+    if config.linkedin_li_at:
+        startup_tasks.append(asyncio.create_task(
+            driver_pool.keep_sessions_alive(config.linkedin_session_refresh_seconds)
+        ))
+    oauth_client = get_linkedin_oauth_client()
+    if oauth_client:
+        startup_tasks.append(asyncio.create_task(
+            oauth_client.token_storage.expire_tokens(TOKEN_EXPIRY_SWEEP_SECONDS)
+        ))
+    try:
+        yield
+    finally:
+        for task in startup_tasks:
+            task.cancel()
+        # Rows buffered by background searches and stream batches would otherwise be lost
+        await flush_all_pending_appends()
+        await driver_pool.close()
+        await close_http_client()
+        await close_linkedin_oauth_client()
+        await task_store.close()
+        if rate_limiter is not None:
+            await rate_limiter.close()
+        if oauth_state_store is not None:
+            await oauth_state_store.close()
+
+
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="LinkedIn Job Search API",
     description="API for searching LinkedIn jobs and adding them to Google Sheets",
     version="0.1.0",
@@ -38,22 +172,50 @@ app = FastAPI(
 )
 
 # Add CORS middleware
+cors_origins = [origin.strip() for origin in config.cors_allow_origins.split(',') if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=cors_origins,
+    # Browsers reject credentialed requests to a wildcard origin
+    allow_credentials="*" not in cors_origins,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=config.cors_max_age_seconds
+)
+
+# Job listings are large, highly compressible JSON. Streamed NDJSON, from /search/stream or
+# /search with an NDJSON Accept header, is excluded so events are not held back in the
+# compressor, and /static may hold pre-compressed assets.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_paths=("/static", "/search/stream"),
+    exclude_media_types=("application/x-ndjson",)
 )
 
+if config.access_log:
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        """Log each request with its status and duration."""
+        started = time.perf_counter()
+        response = await call_next(request)
+        logger.info(
+            "%s %s %d %.1fms", request.method, request.url.path, response.status_code,
+            (time.perf_counter() - started) * 1000
+        )
+        return response
+
 # Mount static files
 static_path = Path(__file__).parent.parent / "static"
 if static_path.exists():
-    app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(static_path), html=True), name="static")
 
 # Request/Response Models
 class JobSearchRequest(BaseModel):
     """Request model for job search."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     keywords: str = Field(..., description="Job search keywords", example="Python developer")
     location: str = Field("", description="Job location", example="San Francisco, CA")
     requirements: List[str] = Field([], description="List of job requirements to match against", example=["Python", "Django", "REST API"])
@@ -67,6 +229,8 @@ class JobSearchRequest(BaseModel):
 
 class CreateSpreadsheetRequest(BaseModel):
     """Request model for creating a new spreadsheet."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str = Field(..., description="Title for the new spreadsheet", example="Python Developer Jobs - 2024")
 
 
@@ -80,7 +244,7 @@ class JobSearchResponse(BaseModel):
     spreadsheet_url: Optional[str] = None
     jobs: List[Dict[str, Any]]
     search_params: Dict[str, Any]
-    timestamp: str
+    timestamp: datetime
 
 
 class SpreadsheetResponse(BaseModel):
@@ -90,13 +254,13 @@ class SpreadsheetResponse(BaseModel):
     spreadsheet_id: Optional[str] = None
     spreadsheet_url: Optional[str] = None
     title: Optional[str] = None
-    timestamp: str
+    timestamp: datetime
 
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str
-    timestamp: str
+    timestamp: datetime
     version: str
     services: Dict[str, str]
 
@@ -125,11 +289,27 @@ class OAuthStatusResponse(BaseModel):
     message: str
 
 
-# Global state for background tasks
-background_tasks_status = {}
+# Status of background searches; shared through Redis when it is configured
+task_store = create_task_store()
+
+# Per-client request counts for the search and posting endpoints; None when disabled
+rate_limiter = create_rate_limiter()
+
+
+async def enforce_rate_limit(request: Request):
+    """Reject the request with 429 if its client has used up the current window."""
+    if rate_limiter is None:
+        return
+    retry_after = await rate_limiter.hit(request.client.host if request.client else "unknown")
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
 
-# OAuth state storage (in production, use Redis or database)
-oauth_states = {}
+# One-time-use guard for signed OAuth states; None when Redis is not configured
+oauth_state_store = create_oauth_state_store()
 
 
 # LinkedIn OAuth Endpoints
@@ -147,11 +327,9 @@ async def linkedin_oauth_authorize():
         
         auth_url, state = oauth_client.get_authorization_url()
         
-        # Store state for validation (in production, use Redis or database)
-        oauth_states[state] = {
-            'created_at': datetime.now(),
-            'used': False
-        }
+        # The state is signed; Redis additionally remembers it so it can only be used once
+        if oauth_state_store is not None:
+            await oauth_state_store.add(state)
         
         return OAuthAuthorizationResponse(
             success=True,
@@ -178,13 +356,12 @@ async def linkedin_oauth_callback(code: str = Query(...), state: str = Query(...
         if not oauth_client:
             raise HTTPException(status_code=503, detail="LinkedIn OAuth not configured")
         
-        # Validate state
-        if state not in oauth_states or oauth_states[state]['used']:
+        # Validate state and, with Redis, mark it as used
+        if not verify_oauth_state(state) or (
+            oauth_state_store is not None and not await oauth_state_store.consume(state)
+        ):
             raise HTTPException(status_code=400, detail="Invalid or expired state parameter")
         
-        # Mark state as used
-        oauth_states[state]['used'] = True
-        
         # Exchange code for token
         token_data = await oauth_client.exchange_code_for_token(code, state)
         
@@ -194,8 +371,8 @@ async def linkedin_oauth_callback(code: str = Query(...), state: str = Query(...
         # Generate user ID (in production, use proper user management)
         user_id = f"linkedin_{profile['id']}"
         
-        # Store token
-        oauth_client.store_user_token(user_id, token_data)
+        # Store token, with the person URN used when posting
+        oauth_client.store_user_token(user_id, token_data, profile)
         
         logger.info(f"OAuth callback successful for user: {user_id}")
         
@@ -214,42 +391,39 @@ async def linkedin_oauth_callback(code: str = Query(...), state: str = Query(...
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _oauth_status_response(authenticated: bool, message: str, user_id: Optional[str] = None,
+                           profile: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
+    # Built directly; the profile is LinkedIn's JSON and needs no validation or re-encoding
+    return ORJSONResponse({
+        "authenticated": authenticated,
+        "user_id": user_id,
+        "profile": profile,
+        "message": message
+    })
+
+
 @app.get("/auth/linkedin/status/{user_id}", response_model=OAuthStatusResponse)
 async def linkedin_oauth_status(user_id: str):
     """Check LinkedIn OAuth authentication status for a user."""
     try:
         oauth_client = get_linkedin_oauth_client()
         if not oauth_client:
-            return OAuthStatusResponse(
-                authenticated=False,
-                message="LinkedIn OAuth not configured"
-            )
+            return _oauth_status_response(False, "LinkedIn OAuth not configured")
         
-        is_authenticated = oauth_client.is_user_authenticated(user_id)
+        # One lookup: checking and then fetching could see the token expire in between
+        token_data = oauth_client.get_user_token(user_id)
         
-        if is_authenticated:
+        if token_data is not None:
             # Get user profile from stored token
-            token_data = oauth_client.get_user_token(user_id)
             try:
                 profile = await oauth_client.get_user_profile(token_data['access_token'])
-                return OAuthStatusResponse(
-                    authenticated=True,
-                    user_id=user_id,
-                    profile=profile,
-                    message="User is authenticated"
-                )
+                return _oauth_status_response(True, "User is authenticated", user_id, profile)
             except LinkedInOAuthError:
                 # Token might be expired
                 oauth_client.remove_user_token(user_id)
-                return OAuthStatusResponse(
-                    authenticated=False,
-                    message="Token expired, please re-authenticate"
-                )
+                return _oauth_status_response(False, "Token expired, please re-authenticate")
         else:
-            return OAuthStatusResponse(
-                authenticated=False,
-                message="User is not authenticated"
-            )
+            return _oauth_status_response(False, "User is not authenticated")
             
     except Exception as e:
         logger.error(f"Error checking OAuth status: {e}")
@@ -274,51 +448,65 @@ async def linkedin_oauth_logout(user_id: str):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+_API_INFO_BODY = orjson.dumps({
+    "name": "LinkedIn Job Search API",
+    "version": "0.1.0",
+    "description": "API for searching LinkedIn jobs and adding them to Google Sheets",
+    "docs": "/docs",
+    "health": "/health"
+})
+
+# Constant JSON bodies may be cached by browsers and any proxy in front of the API
+_STATIC_JSON_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# The web interface is a single static page, so read it once instead of per request
+_index_path = static_path / "index.html"
+_INDEX_BYTES = _index_path.read_bytes() if _index_path.exists() else None
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_BYTES).hexdigest()}"' if _INDEX_BYTES is not None else None
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=300"} if _INDEX_ETAG else {}
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main web interface."""
-    static_path = Path(__file__).parent.parent / "static" / "index.html"
-    if static_path.exists():
-        return FileResponse(str(static_path))
+    if _INDEX_BYTES is not None:
+        if request.headers.get("if-none-match") == _INDEX_ETAG:
+            return Response(status_code=304, headers=_INDEX_HEADERS)
+        return Response(content=_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
     else:
-        return {
-            "name": "LinkedIn Job Search API",
-            "version": "0.1.0",
-            "description": "API for searching LinkedIn jobs and adding them to Google Sheets",
-            "docs": "/docs",
-            "health": "/health"
-        }
+        return Response(content=_API_INFO_BODY, media_type="application/json", headers=_STATIC_JSON_HEADERS)
 
 
 @app.get("/api", response_model=Dict[str, str])
 async def api_info():
     """API information endpoint."""
-    return {
-        "name": "LinkedIn Job Search API",
-        "version": "0.1.0",
-        "description": "API for searching LinkedIn jobs and adding them to Google Sheets",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_API_INFO_BODY, media_type="application/json", headers=_STATIC_JSON_HEADERS)
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint."""
+# Last service probe results, served by /health; "checking" until the first probe finishes
+_health_cache: Dict[str, Any] = {
+    "services": {
+        "chrome_driver": "checking",
+        "google_sheets": "checking",
+        "linkedin_oauth": "checking"
+    },
+    "checked_at": None
+}
+
+
+def _probe_services() -> Dict[str, str]:
+    """Check the external services the API depends on."""
     services = {}
     
     # Check Chrome WebDriver
     try:
-        from selenium import webdriver
-        from webdriver_manager.chrome import ChromeDriverManager
-        ChromeDriverManager().install()
+        get_chromedriver_path()
         services["chrome_driver"] = "available"
     except Exception as e:
         services["chrome_driver"] = f"error: {str(e)}"
     
     # Check Google Sheets credentials
     try:
-        import os
         if os.path.exists(config.google_credentials_path):
             services["google_sheets"] = "credentials_found"
         else:
@@ -336,32 +524,108 @@ async def health_check():
     except Exception as e:
         services["linkedin_oauth"] = f"error: {str(e)}"
     
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now().isoformat(),
-        version="0.1.0",
-        services=services
+    return services
+
+
+async def _refresh_health_cache():
+    """Re-run the service probes off the event loop and store the results."""
+    loop = asyncio.get_running_loop()
+    services = await loop.run_in_executor(None, _probe_services)
+    _health_cache["services"] = services
+    _health_cache["checked_at"] = datetime.now()
+
+
+async def _refresh_health_loop():
+    """Probe services now, then refresh the cached results periodically."""
+    while True:
+        try:
+            await _refresh_health_cache()
+        except Exception as e:
+            logger.error(f"Error refreshing health checks: {e}")
+        await asyncio.sleep(HEALTH_REFRESH_SECONDS)
+
+
+@app.get("/health", response_model=HealthResponse)
+async def health_check():
+    """Health check endpoint."""
+    # Returned directly; the shape is fixed, so skip response model validation
+    return ORJSONResponse({
+        "status": "healthy",
+        "timestamp": datetime.now(),
+        "version": "0.1.0",
+        "services": _health_cache["services"]
+    })
+
+
+# Fields that only affect where results are written, not what the scrape returns
+_SEARCH_CACHE_EXCLUDE = {"spreadsheet_id", "filter_duplicates"}
+
+_search_cache: TTLCache = TTLCache(maxsize=config.search_cache_size, ttl=config.search_cache_ttl_seconds)
+_inflight_searches: Dict[bytes, asyncio.Task] = {}
+
+
+def _search_cache_key(params: Dict[str, Any]) -> bytes:
+    """Fingerprint of the scrape parameters of a dumped search request."""
+    scrape_params = {name: value for name, value in params.items() if name not in _SEARCH_CACHE_EXCLUDE}
+    return hashlib.blake2b(orjson.dumps(scrape_params, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+
+
+def _finish_inflight_search(key: bytes, task: asyncio.Task):
+    _inflight_searches.pop(key, None)
+    # An empty result usually means the results page failed to load, so it is not cached
+    if not task.cancelled() and task.exception() is None and task.result():
+        _search_cache[key] = task.result()
+
+
+async def _cached_search(request: JobSearchRequest, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a LinkedIn search, reusing recent results and joining identical in-flight scrapes."""
+    if config.search_cache_ttl_seconds <= 0:
+        return await _run_search(request)
+    
+    key = _search_cache_key(params)
+    jobs = _search_cache.get(key)
+    if jobs is not None:
+        logger.info(f"Serving cached results for: {request.keywords} in {request.location}")
+        return jobs
+    
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.create_task(_run_search(request))
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda done: _finish_inflight_search(key, done))
+    
+    # Shielded so one client disconnecting does not cancel the scrape for the others
+    return await asyncio.shield(task)
+
+
+async def _run_search(request: JobSearchRequest) -> List[Dict[str, Any]]:
+    return await search_linkedin_jobs(
+        keywords=request.keywords,
+        location=request.location,
+        requirements=request.requirements,
+        max_jobs=request.max_jobs,
+        experience_level=request.experience_level,
+        employment_type=request.employment_type,
+        date_posted=request.date_posted
     )
 
 
-@app.post("/search", response_model=JobSearchResponse)
-async def search_jobs(request: JobSearchRequest):
+@app.post("/search", response_model=JobSearchResponse, dependencies=[Depends(enforce_rate_limit)])
+async def search_jobs(request: JobSearchRequest, http_request: Request):
     """Search for jobs on LinkedIn and optionally add them to Google Sheets."""
+    # Clients that accept NDJSON get jobs streamed as they are scraped, as from /search/stream
+    if "application/x-ndjson" in http_request.headers.get("accept", ""):
+        return await search_jobs_stream(request)
+    
     try:
         logger.info(f"Job search request: {request.keywords} in {request.location}")
+        # Dumped once: used for the cache key and echoed back in the response
+        params = request.model_dump()
         
         # Search for jobs
-        jobs = await search_linkedin_jobs(
-            keywords=request.keywords,
-            location=request.location,
-            requirements=request.requirements,
-            max_jobs=request.max_jobs,
-            experience_level=request.experience_level,
-            employment_type=request.employment_type,
-            date_posted=request.date_posted
-        )
+        jobs = await _cached_search(request, params)
         
-        matching_jobs = len([job for job in jobs if job.get('is_match', True)])
+        matching_jobs = sum(1 for job in jobs if job.get('is_match', True))
         jobs_added_to_sheets = None
         spreadsheet_url = None
         
@@ -395,29 +659,114 @@ async def search_jobs(request: JobSearchRequest):
             jobs_added_to_sheets=jobs_added_to_sheets,
             spreadsheet_url=spreadsheet_url,
             jobs=jobs,
-            search_params=request.dict(),
-            timestamp=datetime.now().isoformat()
+            search_params=params,
+            timestamp=datetime.now()
         )
         
     except Exception as e:
-        logger.error(f"Error in job search: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in job search: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/search/async")
+# Jobs appended to Google Sheets per call while a search is streamed
+STREAM_SHEETS_BATCH_SIZE = 50
+
+
+@app.post("/search/stream", dependencies=[Depends(enforce_rate_limit)])
+async def search_jobs_stream(request: JobSearchRequest):
+    """Search for jobs and stream them back as NDJSON while they are scraped.
+    
+    Each line is an object with an ``event`` ("job", "summary" or "error")
+    and its ``data``.
+    """
+    logger.info(f"Streaming job search request: {request.keywords} in {request.location}")
+    
+    async def generate():
+        jobs_found = 0
+        matching_jobs = 0
+        batch = []
+        sheets_tasks = []
+        
+        def add_batch_to_sheets():
+            sheets_tasks.append(asyncio.create_task(add_jobs_to_sheets(
+                jobs=list(batch),
+                spreadsheet_id=request.spreadsheet_id,
+                filter_duplicates=request.filter_duplicates
+            )))
+            batch.clear()
+        
+        try:
+            async for job in stream_linkedin_jobs(
+                keywords=request.keywords,
+                location=request.location,
+                requirements=request.requirements,
+                max_jobs=request.max_jobs,
+                experience_level=request.experience_level,
+                employment_type=request.employment_type,
+                date_posted=request.date_posted
+            ):
+                jobs_found += 1
+                if job.get('is_match', True):
+                    matching_jobs += 1
+                
+                yield orjson.dumps({"event": "job", "data": job}) + b"\n"
+                
+                if request.spreadsheet_id:
+                    batch.append(job)
+                    if len(batch) >= STREAM_SHEETS_BATCH_SIZE:
+                        add_batch_to_sheets()
+            
+            if batch:
+                add_batch_to_sheets()
+            
+            jobs_added_to_sheets = None
+            spreadsheet_url = None
+            for sheets_result in await asyncio.gather(*sheets_tasks):
+                if sheets_result["success"]:
+                    jobs_added_to_sheets = (jobs_added_to_sheets or 0) + sheets_result["jobs_added"]
+                    spreadsheet_url = sheets_result.get("spreadsheet_url") or spreadsheet_url
+                else:
+                    logger.warning(f"Failed to add jobs to sheets: {sheets_result.get('error')}")
+            
+            yield orjson.dumps({"event": "summary", "data": {
+                "jobs_found": jobs_found,
+                "matching_jobs": matching_jobs,
+                "jobs_added_to_sheets": jobs_added_to_sheets,
+                "spreadsheet_url": spreadsheet_url,
+                "timestamp": datetime.now()
+            }}) + b"\n"
+            
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(f"Error in streaming job search: {e}")
+            yield orjson.dumps({"event": "error", "data": {"message": str(e)}}) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@app.post("/search/async", dependencies=[Depends(enforce_rate_limit)])
 async def search_jobs_async(request: JobSearchRequest, background_tasks: BackgroundTasks):
     """Start an asynchronous job search and return a task ID."""
-    import uuid
-    task_id = str(uuid.uuid4())
+    request_data = request.model_dump()
+    if search_jobs_task is not None:
+        # Hand the search to a Celery worker; state lives in the result backend.
+        # Publishing talks to the broker, so keep it off the event loop.
+        loop = asyncio.get_running_loop()
+        task = await loop.run_in_executor(None, search_jobs_task.delay, request_data)
+        task_id = task.id
+    else:
+        import uuid
+        task_id = str(uuid.uuid4())
     
-    background_tasks_status[task_id] = {
+    # Also recorded for Celery tasks, which report PENDING for unknown ids until picked up
+    await task_store.create(task_id, {
         "status": "started",
         "timestamp": datetime.now().isoformat(),
-        "request": request.dict()
-    }
+        "request": request_data
+    })
     
-    background_tasks.add_task(run_job_search_background, task_id, request)
+    if search_jobs_task is None:
+        background_tasks.add_task(run_job_search_background, task_id, request_data)
     
     return {
         "task_id": task_id,
@@ -430,64 +779,40 @@ async def search_jobs_async(request: JobSearchRequest, background_tasks: Backgro
 @app.get("/search/status/{task_id}")
 async def get_search_status(task_id: str):
     """Get the status of an asynchronous job search."""
-    if task_id not in background_tasks_status:
+    loop = asyncio.get_running_loop()
+    celery_status = await loop.run_in_executor(None, get_celery_task_status, task_id)
+    if celery_status is not None:
+        return ORJSONResponse(celery_status)
+    
+    task_status = await task_store.get(task_id)
+    if task_status is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    return background_tasks_status[task_id]
+    # Completed statuses carry every scraped job; encode them without walking them first
+    return ORJSONResponse(task_status)
 
 
-async def run_job_search_background(task_id: str, request: JobSearchRequest):
+async def run_job_search_background(task_id: str, request_data: Dict[str, Any]):
     """Run job search in background."""
     try:
-        background_tasks_status[task_id]["status"] = "running"
+        await task_store.update(task_id, status="running")
         
-        # Search for jobs
-        jobs = await search_linkedin_jobs(
-            keywords=request.keywords,
-            location=request.location,
-            requirements=request.requirements,
-            max_jobs=request.max_jobs,
-            experience_level=request.experience_level,
-            employment_type=request.employment_type,
-            date_posted=request.date_posted
-        )
-        
-        matching_jobs = len([job for job in jobs if job.get('is_match', True)])
-        jobs_added_to_sheets = None
-        spreadsheet_url = None
+        result = await run_job_search(request_data)
         
-        # Add to Google Sheets if spreadsheet_id is provided
-        if request.spreadsheet_id:
-            sheets_result = await add_jobs_to_sheets(
-                jobs=jobs,
-                spreadsheet_id=request.spreadsheet_id,
-                filter_duplicates=request.filter_duplicates
-            )
-            
-            if sheets_result["success"]:
-                jobs_added_to_sheets = sheets_result["jobs_added"]
-                spreadsheet_url = sheets_result.get("spreadsheet_url")
-        
-        background_tasks_status[task_id] = {
-            "status": "completed",
-            "timestamp": datetime.now().isoformat(),
-            "request": request.dict(),
-            "result": {
-                "jobs_found": len(jobs),
-                "matching_jobs": matching_jobs,
-                "jobs_added_to_sheets": jobs_added_to_sheets,
-                "spreadsheet_url": spreadsheet_url,
-                "jobs": jobs
-            }
-        }
+        await task_store.update(
+            task_id,
+            status="completed",
+            timestamp=datetime.now().isoformat(),
+            result=result
+        )
         
     except Exception as e:
-        background_tasks_status[task_id] = {
-            "status": "failed",
-            "timestamp": datetime.now().isoformat(),
-            "request": request.dict(),
-            "error": str(e)
-        }
+        await task_store.update(
+            task_id,
+            status="failed",
+            timestamp=datetime.now().isoformat(),
+            error=str(e)
+        )
 
 
 @app.post("/spreadsheet/create", response_model=SpreadsheetResponse)
@@ -496,17 +821,17 @@ async def create_spreadsheet(request: CreateSpreadsheetRequest):
     try:
         logger.info(f"Creating spreadsheet: {request.title}")
         
-        client = GoogleSheetsClient()
-        spreadsheet_id = client.create_spreadsheet(request.title)
-        spreadsheet_info = client.get_spreadsheet_info(spreadsheet_id)
+        client = get_sheets_client()
+        loop = asyncio.get_running_loop()
+        spreadsheet_id = await loop.run_in_executor(None, client.create_spreadsheet, request.title)
         
         return SpreadsheetResponse(
             success=True,
             message=f"Successfully created spreadsheet: {request.title}",
             spreadsheet_id=spreadsheet_id,
-            spreadsheet_url=spreadsheet_info["url"],
-            title=spreadsheet_info["title"],
-            timestamp=datetime.now().isoformat()
+            spreadsheet_url=spreadsheet_url(spreadsheet_id),
+            title=request.title,
+            timestamp=datetime.now()
         )
         
     except Exception as e:
@@ -518,59 +843,71 @@ async def create_spreadsheet(request: CreateSpreadsheetRequest):
 async def get_spreadsheet_info(spreadsheet_id: str):
     """Get information about a Google Spreadsheet."""
     try:
-        client = GoogleSheetsClient(spreadsheet_id)
-        info = client.get_spreadsheet_info()
-        existing_jobs = client.get_existing_jobs()
+        loop = asyncio.get_running_loop()
+        client = await loop.run_in_executor(None, get_sheets_client().for_spreadsheet, spreadsheet_id)
+        # Both calls block on the Sheets API, so run them side by side on the executor.
+        # The job count is served from the cached URL column until its TTL expires.
+        info, existing_jobs_count = await asyncio.gather(
+            loop.run_in_executor(None, client.get_spreadsheet_info),
+            loop.run_in_executor(None, client.count_existing_jobs)
+        )
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "spreadsheet_id": spreadsheet_id,
             "title": info["title"],
             "url": info["url"],
             "sheets": info["sheets"],
-            "existing_jobs_count": len(existing_jobs),
-            "timestamp": datetime.now().isoformat()
-        }
+            "existing_jobs_count": existing_jobs_count,
+            "timestamp": datetime.now()
+        })
         
     except Exception as e:
         logger.error(f"Error getting spreadsheet info: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# The filter options never change, so encode them once at import time
+_JOB_FILTERS_BODY = orjson.dumps({
+    "experience_levels": [
+        {"value": "", "label": "Any"},
+        {"value": "internship", "label": "Internship"},
+        {"value": "entry", "label": "Entry Level"},
+        {"value": "associate", "label": "Associate"},
+        {"value": "mid", "label": "Mid Level"},
+        {"value": "director", "label": "Director"},
+        {"value": "executive", "label": "Executive"}
+    ],
+    "employment_types": [
+        {"value": "", "label": "Any"},
+        {"value": "full-time", "label": "Full-time"},
+        {"value": "part-time", "label": "Part-time"},
+        {"value": "contract", "label": "Contract"},
+        {"value": "temporary", "label": "Temporary"},
+        {"value": "internship", "label": "Internship"}
+    ],
+    "date_posted": [
+        {"value": "", "label": "Any time"},
+        {"value": "past 24 hours", "label": "Past 24 hours"},
+        {"value": "past week", "label": "Past week"},
+        {"value": "past month", "label": "Past month"}
+    ]
+})
+
+
 @app.get("/jobs/filters")
 async def get_job_filters():
     """Get available job search filters."""
-    return {
-        "experience_levels": [
-            {"value": "", "label": "Any"},
-            {"value": "internship", "label": "Internship"},
-            {"value": "entry", "label": "Entry Level"},
-            {"value": "associate", "label": "Associate"},
-            {"value": "mid", "label": "Mid Level"},
-            {"value": "director", "label": "Director"},
-            {"value": "executive", "label": "Executive"}
-        ],
-        "employment_types": [
-            {"value": "", "label": "Any"},
-            {"value": "full-time", "label": "Full-time"},
-            {"value": "part-time", "label": "Part-time"},
-            {"value": "contract", "label": "Contract"},
-            {"value": "temporary", "label": "Temporary"},
-            {"value": "internship", "label": "Internship"}
-        ],
-        "date_posted": [
-            {"value": "", "label": "Any time"},
-            {"value": "past 24 hours", "label": "Past 24 hours"},
-            {"value": "past week", "label": "Past week"},
-            {"value": "past month", "label": "Past month"}
-        ]
-    }
+    return Response(content=_JOB_FILTERS_BODY, media_type="application/json", headers=_STATIC_JSON_HEADERS)
 
 
-@app.get("/config")
-async def get_config():
-    """Get current configuration (non-sensitive values only)."""
-    return {
+_config_body: Optional[bytes] = None
+
+
+def _snapshot_config() -> bytes:
+    """Encode the non-sensitive configuration values served by /config."""
+    global _config_body
+    _config_body = orjson.dumps({
         "chrome_headless": config.chrome_headless,
         "search_delay_seconds": config.search_delay_seconds,
         "max_concurrent_searches": config.max_concurrent_searches,
@@ -579,10 +916,23 @@ async def get_config():
         "google_credentials_configured": bool(config.google_credentials_path),
         "default_spreadsheet_configured": bool(config.google_spreadsheet_id),
         "linkedin_oauth_configured": bool(config.linkedin_client_id and config.linkedin_client_secret)
-    }
+    })
+    return _config_body
+
+
+@app.get("/config")
+async def get_config():
+    """Get current configuration (non-sensitive values only)."""
+    return Response(
+        content=_config_body or _snapshot_config(),
+        media_type="application/json",
+        headers=_STATIC_JSON_HEADERS
+    )
 
 
 # LinkedIn API Endpoints (OAuth-enabled)
+# LinkedIn's JSON is passed through as-is, so these return ORJSONResponse directly rather
+# than having FastAPI walk the payload with jsonable_encoder first
 
 @app.get("/linkedin/profile/{user_id}")
 async def get_linkedin_profile(user_id: str):
@@ -592,27 +942,29 @@ async def get_linkedin_profile(user_id: str):
         if not oauth_client:
             raise HTTPException(status_code=503, detail="LinkedIn OAuth not configured")
         
-        if not oauth_client.is_user_authenticated(user_id):
+        token_data = oauth_client.get_user_token(user_id)
+        if token_data is None:
             raise HTTPException(status_code=401, detail="User not authenticated with LinkedIn")
         
-        token_data = oauth_client.get_user_token(user_id)
         profile = await oauth_client.get_user_profile(token_data['access_token'])
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "profile": profile,
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": datetime.now()
+        })
         
     except LinkedInOAuthError as e:
         logger.error(f"LinkedIn API error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
         logger.error(f"Unexpected error getting LinkedIn profile: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.post("/linkedin/post/{user_id}")
+@app.post("/linkedin/post/{user_id}", dependencies=[Depends(enforce_rate_limit)])
 async def post_to_linkedin(user_id: str, content: str = Body(..., embed=True)):
     """Post content to LinkedIn for authenticated user."""
     try:
@@ -627,18 +979,20 @@ async def post_to_linkedin(user_id: str, content: str = Body(..., embed=True)):
         result = await api_client.post_update(user_id, content)
         
         if result["success"]:
-            return {
+            return ORJSONResponse({
                 "success": True,
                 "message": "Successfully posted to LinkedIn",
                 "post_id": result.get("post_id"),
-                "timestamp": datetime.now().isoformat()
-            }
+                "timestamp": datetime.now()
+            })
         else:
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to post to LinkedIn"))
             
     except LinkedInOAuthError as e:
         logger.error(f"LinkedIn API error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
         logger.error(f"Unexpected error posting to LinkedIn: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -658,34 +1012,38 @@ async def get_linkedin_connections(user_id: str):
         
         result = await api_client.get_user_connections(user_id)
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "connections": result,
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": datetime.now()
+        })
         
     except LinkedInOAuthError as e:
         logger.error(f"LinkedIn API error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
         logger.error(f"Unexpected error getting LinkedIn connections: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 # Error handlers
+# Registered for FastAPI's HTTPException only: 404/405s raised by routing and StaticFiles
+# are Starlette HTTPExceptions and keep Starlette's cheap {"detail": ...} response
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=create_error_response(exc, f"HTTP {exc.status_code}")
+        content=create_error_response(exc, f"HTTP {exc.status_code}"),
+        headers=exc.headers
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    logger.error(f"Unhandled exception: {exc}")
-    logger.error(traceback.format_exc())
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return ORJSONResponse(
         status_code=500,
         content=create_error_response(exc, "Internal server error")
     )
@@ -696,22 +1054,75 @@ def create_app():
     return app
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
+def _uvicorn_options() -> Dict[str, Any]:
+    """Event loop, HTTP parser and logging options for uvicorn."""
+    # uvloop and httptools come with uvicorn[standard]; uvloop is not available on Windows
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "log_level": config.log_level.lower(),
+        # Requests are logged by our own middleware when ACCESS_LOG is enabled
+        "access_log": False,
+        # Client addresses (and so rate limit keys) come from X-Forwarded-For behind these proxies
+        "proxy_headers": True,
+        "forwarded_allow_ips": config.forwarded_allow_ips
+    }
+
+
+def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False,
+               workers: Optional[int] = None):
     """Run the FastAPI server."""
-    uvicorn.run(
-        "linkedin_job_mcp.api:app",
-        host=host,
-        port=port,
-        reload=reload,
-        log_level="info"
-    )
+    # One process unless more are asked for: every worker has its own Chrome pool and
+    # its own in-memory OAuth tokens, search cache and (without Redis) task statuses
+    workers = workers or config.web_concurrency or 1
+    
+    if reload or workers == 1:
+        # The reloader only supports a single process
+        uvicorn.run(
+            "linkedin_job_mcp.api:app",
+            host=host,
+            port=port,
+            reload=reload,
+            **_uvicorn_options()
+        )
+        return
+    
+    # Inherited by the worker processes, which then skip warming a full driver pool each
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    
+    if importlib.util.find_spec("gunicorn") is None:
+        logger.warning("gunicorn not installed, falling back to uvicorn's process manager")
+        uvicorn.run(
+            "linkedin_job_mcp.api:app",
+            host=host,
+            port=port,
+            workers=workers,
+            **_uvicorn_options()
+        )
+        return
+    
+    args = [
+        sys.executable, "-m", "gunicorn", "linkedin_job_mcp.api:app",
+        "--worker-class", "uvicorn.workers.UvicornWorker",
+        "--workers", str(workers),
+        "--bind", f"{host}:{port}",
+        "--log-level", config.log_level.lower(),
+        # A search can legitimately run for the whole scrape timeout
+        "--timeout", str(config.job_search_timeout + 30),
+        "--forwarded-allow-ips", config.forwarded_allow_ips,
+        # Import the app once in the master so workers share its pages copy-on-write
+        "--preload"
+    ]
+    if os.path.isdir("/dev/shm"):
+        # Worker heartbeats on tmpfs never block on a slow disk
+        args += ["--worker-tmp-dir", "/dev/shm"]
+    
+    logger.info(f"Starting gunicorn with {workers} workers on {host}:{port}")
+    os.execv(sys.executable, args)
 
 
 # For direct uvicorn usage
 if __name__ == "__main__":
-    import sys
-    import os
-    
     # Add project root to path
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, project_root)
@@ -1,12 +1,10 @@
 """Configuration management for LinkedIn Job MCP Server."""
 
-import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-load_dotenv()
+from dotenv import find_dotenv
 
 
 class Config(BaseSettings):
@@ -31,6 +29,14 @@ class Config(BaseSettings):
         default=None,
         description="LinkedIn password for authenticated searches (optional)"
     )
+    linkedin_li_at: Optional[str] = Field(
+        default=None,
+        description="LinkedIn li_at session cookie used to sign in pooled browsers (optional)"
+    )
+    linkedin_session_refresh_seconds: float = Field(
+        default=300.0,
+        description="How often idle signed-in browsers reload LinkedIn to keep the session alive"
+    )
     
     # LinkedIn OAuth Configuration
     linkedin_client_id: Optional[str] = Field(
@@ -49,11 +55,19 @@ class Config(BaseSettings):
         default="r_liteprofile,r_emailaddress,w_member_social",
         description="LinkedIn OAuth scopes (comma-separated)"
     )
+    linkedin_api_concurrency: int = Field(
+        default=10,
+        description="Maximum number of concurrent authenticated LinkedIn API requests"
+    )
     
     # OAuth Token Storage
     oauth_secret_key: str = Field(
         default="your-secret-key-change-this-in-production",
-        description="Secret key for encrypting OAuth tokens"
+        description="Secret key for signing OAuth state parameters"
+    )
+    oauth_state_ttl_seconds: int = Field(
+        default=600,
+        description="How long an OAuth authorization state stays valid"
     )
     
     # Chrome WebDriver Configuration
@@ -75,6 +89,10 @@ class Config(BaseSettings):
         default=3,
         description="Maximum number of concurrent search operations"
     )
+    detail_fetch_concurrency: int = Field(
+        default=5,
+        description="Maximum number of job detail pages fetched concurrently per search"
+    )
     
     # Job Search Configuration
     max_jobs_per_search: int = Field(
@@ -85,12 +103,95 @@ class Config(BaseSettings):
         default=30,
         description="Timeout for job search operations in seconds"
     )
+    search_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="How long /search results are reused for identical queries (0 disables caching)"
+    )
+    search_cache_size: int = Field(
+        default=512,
+        description="Maximum number of distinct /search queries kept in the result cache"
+    )
+    
+    # API Server
+    web_concurrency: int = Field(
+        default=1,
+        description="Number of API worker processes"
+    )
+    log_level: str = Field(
+        default="info",
+        description="Log level for the API and its server (debug, info, warning, error)"
+    )
+    access_log: bool = Field(
+        default=False,
+        description="Log every API request with its status and duration"
+    )
+    cors_allow_origins: str = Field(
+        default="http://localhost:8000,http://127.0.0.1:8000",
+        description="Origins allowed to call the API from a browser (comma-separated)"
+    )
+    cors_max_age_seconds: int = Field(
+        default=86400,
+        description="How long browsers may cache CORS preflight responses"
+    )
+    rate_limit_requests: int = Field(
+        default=10,
+        description="Search and posting requests allowed per client per window (0 disables the limit)"
+    )
+    rate_limit_window_seconds: int = Field(
+        default=60,
+        description="Length of the rate limit window"
+    )
+    forwarded_allow_ips: str = Field(
+        default="127.0.0.1",
+        description="Comma-separated proxy IPs trusted to set X-Forwarded-For ('*' trusts any)"
+    )
+    
+    # Background Task Queue
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis URL used as Celery broker and result backend (enables Celery workers)"
+    )
+    celery_search_queue: str = Field(
+        default="search_queue",
+        description="Celery queue that job search tasks are routed to"
+    )
+    task_status_ttl_seconds: int = Field(
+        default=3600,
+        description="How long background search statuses are kept"
+    )
+    
+    # Google Sheets Write Buffering
+    sheets_flush_delay_seconds: float = Field(
+        default=2.0,
+        description="Longest time job rows wait for another append to the same spreadsheet before being written"
+    )
+    sheets_flush_max_rows: int = Field(
+        default=500,
+        description="Number of buffered job rows that triggers an immediate append"
+    )
+    existing_jobs_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="How long the cached job URLs of a spreadsheet are trusted before re-reading them"
+    )
+    spreadsheet_info_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="How long a spreadsheet's title and tab names are cached"
+    )
     
     class Config:
-        env_file = ".env"
+        # Searched for upwards from this package, as load_dotenv() did, so the file is found
+        # whatever the working directory; pydantic-settings then reads it once
+        env_file = find_dotenv() or ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
 
 
-# Global configuration instance
-config = Config()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the configuration, parsing the environment and .env file only once."""
+    return Config()
+
+
+# Global configuration instance; module-level settings (the Selenium pool size, the
+# Redis-only imports) are read at import, so it is built then and shared by every caller
+config = get_config()
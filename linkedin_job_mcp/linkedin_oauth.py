@@ -1,20 +1,38 @@
 """LinkedIn OAuth 2.0 authentication module."""
 
-import json
+import asyncio
+import functools
+import hashlib
+import heapq
+import hmac
 import secrets
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import threading
+import time
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import urlencode, parse_qs, urlparse
 
 import httpx
-from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
+import orjson
 from fastapi import HTTPException
 
 from .config import config
 
+# Only imported when Redis is configured; it is a slow import that is otherwise unused
+aioredis = None
+if config.redis_url:
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        pass
+
 logger = logging.getLogger(__name__)
 
+# Shared by every request; read-only so no caller can change them for the others
+_JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+_FORM_HEADERS = MappingProxyType({'Content-Type': 'application/x-www-form-urlencoded'})
+
 
 class LinkedInOAuthError(Exception):
     """Custom exception for LinkedIn OAuth errors."""
@@ -22,57 +40,107 @@ class LinkedInOAuthError(Exception):
 
 
 class TokenStorage:
-    """Simple in-memory token storage with encryption."""
+    """Simple in-memory token storage."""
+    
+    __slots__ = ('_tokens', '_expiry_heap', '_lock')
+    
+    # Tokens this close to expiry are treated as expired, so they don't lapse mid-request
+    EXPIRY_MARGIN_SECONDS = 60
     
-    def __init__(self, secret_key: str):
-        self.serializer = URLSafeTimedSerializer(secret_key)
+    def __init__(self):
+        # Plain dicts: the tokens never leave this process, so signing them on every
+        # access (itsdangerous signs, it does not encrypt) protected nothing
         self._tokens = {}
+        # (expires_at, user_id) min-heap, so expired tokens are dropped without scanning
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Guards the dict and heap together. Every method is synchronous, so coroutines
+        # never interleave inside one; the lock is for callers on executor threads. The
+        # sections are a few dict/heap operations, too short for per-user locks to help.
+        self._lock = threading.Lock()
+    
+    def _sweep(self, now: float) -> None:
+        """Remove tokens that have expired, even for users who never come back."""
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, user_id = heapq.heappop(self._expiry_heap)
+            # The user may have stored a newer token since this entry was pushed
+            token_info = self._tokens.get(user_id)
+            if token_info is not None and token_info['expires_at'] <= now:
+                del self._tokens[user_id]
     
-    def store_token(self, user_id: str, token_data: Dict[str, Any]) -> None:
-        """Store encrypted token data."""
+    def remove_expired(self) -> None:
+        """Drop every expired token now."""
+        with self._lock:
+            self._sweep(time.monotonic())
+    
+    async def expire_tokens(self, interval: float):
+        """Periodically drop expired tokens, so idle servers reclaim them too."""
+        while True:
+            await asyncio.sleep(interval)
+            self.remove_expired()
+    
+    def store_token(self, user_id: str, token_data: Dict[str, Any], person_urn: Optional[str] = None) -> None:
+        """Store token data, with the user's person URN when it is known."""
         try:
-            encrypted_token = self.serializer.dumps(token_data)
-            self._tokens[user_id] = {
-                'token': encrypted_token,
-                'created_at': datetime.now(),
-                'expires_at': datetime.now() + timedelta(seconds=token_data.get('expires_in', 3600))
+            # Monotonic, so expiry checks are float compares and ignore wall-clock changes
+            now = time.monotonic()
+            expires_at = now + token_data.get('expires_in', 3600) - self.EXPIRY_MARGIN_SECONDS
+            token_info = {
+                'token': dict(token_data),
+                'created_at': now,
+                'expires_at': expires_at,
+                'person_urn': person_urn
             }
+            with self._lock:
+                self._sweep(now)
+                self._tokens[user_id] = token_info
+                heapq.heappush(self._expiry_heap, (expires_at, user_id))
+                if len(self._expiry_heap) > 2 * len(self._tokens) + 64:
+                    # Replaced tokens leave stale heap entries behind; rebuild from the live ones
+                    self._expiry_heap = [(info['expires_at'], uid) for uid, info in self._tokens.items()]
+                    heapq.heapify(self._expiry_heap)
             logger.info(f"Token stored for user: {user_id}")
         except Exception as e:
-            logger.error(f"Error storing token: {e}")
+            logger.error("Error storing token: %s", e)
             raise LinkedInOAuthError(f"Failed to store token: {e}")
     
-    def get_token(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve and decrypt token data."""
-        try:
-            if user_id not in self._tokens:
-                return None
-            
-            token_info = self._tokens[user_id]
-            
-            # Check if token is expired
-            if datetime.now() > token_info['expires_at']:
-                logger.warning(f"Token expired for user: {user_id}")
-                del self._tokens[user_id]
-                return None
-            
-            # Decrypt token
-            token_data = self.serializer.loads(token_info['token'], max_age=3600*24*30)  # 30 days max
-            return token_data
-            
-        except (BadSignature, SignatureExpired) as e:
-            logger.error(f"Token decryption failed for user {user_id}: {e}")
-            if user_id in self._tokens:
-                del self._tokens[user_id]
+    def _get_token_info(self, user_id: str) -> Optional[Dict[str, Any]]:
+        token_info = self._tokens.get(user_id)
+        if token_info is None:
             return None
-        except Exception as e:
-            logger.error(f"Error retrieving token: {e}")
+        
+        # Check if token is expired
+        if time.monotonic() >= token_info['expires_at']:
+            logger.warning("Token expired for user: %s", user_id)
+            with self._lock:
+                # Only drop it if no fresh token was stored in the meantime
+                if self._tokens.get(user_id) is token_info:
+                    del self._tokens[user_id]
             return None
+        
+        return token_info
+    
+    def get_token(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve token data."""
+        token_info = self._get_token_info(user_id)
+        return token_info['token'] if token_info is not None else None
+    
+    def get_person_urn(self, user_id: str) -> Optional[str]:
+        """Retrieve the person URN cached with a user's token."""
+        token_info = self._get_token_info(user_id)
+        return token_info['person_urn'] if token_info is not None else None
+    
+    def set_person_urn(self, user_id: str, person_urn: str) -> None:
+        """Cache a user's person URN alongside their current token."""
+        with self._lock:
+            token_info = self._tokens.get(user_id)
+            if token_info is not None:
+                token_info['person_urn'] = person_urn
     
     def remove_token(self, user_id: str) -> None:
         """Remove token for user."""
-        if user_id in self._tokens:
-            del self._tokens[user_id]
+        with self._lock:
+            removed = self._tokens.pop(user_id, None)
+        if removed is not None:
             logger.info(f"Token removed for user: {user_id}")
 
 
@@ -85,33 +153,59 @@ class LinkedInOAuthClient:
     PROFILE_URL = "https://api.linkedin.com/v2/people/~"
     EMAIL_URL = "https://api.linkedin.com/v2/emailAddress?q=members&projection=(elements*(handle~))"
     
+    __slots__ = (
+        'client_id', 'client_secret', 'redirect_uri', 'scopes', 'scope_str', 'token_storage',
+        '_authorization_url_prefix', '_http_client', '_request_semaphore', '_inflight_gets'
+    )
+    
     def __init__(self):
         self.client_id = config.linkedin_client_id
         self.client_secret = config.linkedin_client_secret
         self.redirect_uri = config.linkedin_redirect_uri
-        self.scopes = config.linkedin_oauth_scopes.split(',')
+        # Spaces after commas in the setting would otherwise end up inside scope names
+        self.scopes = [scope.strip() for scope in config.linkedin_oauth_scopes.split(',') if scope.strip()]
+        self.scope_str = ' '.join(self.scopes)
         
         if not self.client_id or not self.client_secret:
             raise LinkedInOAuthError("LinkedIn OAuth credentials not configured")
         
-        self.token_storage = TokenStorage(config.oauth_secret_key)
+        self.token_storage = TokenStorage()
+        # Only the state differs between authorization URLs
+        self._authorization_url_prefix = f"{self.AUTHORIZATION_URL}?" + urlencode({
+            'response_type': 'code',
+            'client_id': self.client_id,
+            'redirect_uri': self.redirect_uri,
+            'scope': self.scope_str
+        })
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Created on first use so they bind to the running event loop
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight_gets: Dict[tuple, asyncio.Task] = {}
         
         logger.info("LinkedIn OAuth client initialized")
     
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by all LinkedIn calls, so TLS connections are reused."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=100, keepalive_expiry=60.0)
+            )
+        return self._http_client
+    
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     def get_authorization_url(self, state: Optional[str] = None) -> tuple[str, str]:
         """Generate LinkedIn authorization URL."""
         if not state:
-            state = secrets.token_urlsafe(32)
+            state = sign_oauth_state()
         
-        params = {
-            'response_type': 'code',
-            'client_id': self.client_id,
-            'redirect_uri': self.redirect_uri,
-            'scope': ' '.join(self.scopes),
-            'state': state
-        }
-        
-        auth_url = f"{self.AUTHORIZATION_URL}?{urlencode(params)}"
+        auth_url = f"{self._authorization_url_prefix}&{urlencode({'state': state})}"
         logger.info(f"Generated authorization URL with state: {state}")
         
         return auth_url, state
@@ -119,78 +213,82 @@ class LinkedInOAuthClient:
     async def exchange_code_for_token(self, authorization_code: str, state: str) -> Dict[str, Any]:
         """Exchange authorization code for access token."""
         try:
-            async with httpx.AsyncClient() as client:
-                data = {
-                    'grant_type': 'authorization_code',
-                    'code': authorization_code,
-                    'redirect_uri': self.redirect_uri,
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret
-                }
-                
-                headers = {
-                    'Content-Type': 'application/x-www-form-urlencoded'
-                }
-                
-                response = await client.post(self.TOKEN_URL, data=data, headers=headers)
-                
-                if response.status_code != 200:
-                    error_msg = f"Token exchange failed: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    raise LinkedInOAuthError(error_msg)
-                
-                token_data = response.json()
-                logger.info("Successfully exchanged authorization code for token")
-                
-                return token_data
-                
+            client = self.http_client
+            data = {
+                'grant_type': 'authorization_code',
+                'code': authorization_code,
+                'redirect_uri': self.redirect_uri,
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            }
+            
+            response = await client.post(self.TOKEN_URL, data=data, headers=_FORM_HEADERS)
+            
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error("Token exchange failed: %s - %s", response.status_code, response.text)
+                raise LinkedInOAuthError(f"Token exchange failed: {response.status_code} - {response.text}") from e
+            
+            token_data = orjson.loads(response.content)
+            logger.info("Successfully exchanged authorization code for token")
+            
+            return token_data
+            
+        except LinkedInOAuthError:
+            raise
         except httpx.RequestError as e:
-            error_msg = f"Network error during token exchange: {e}"
-            logger.error(error_msg)
-            raise LinkedInOAuthError(error_msg)
+            logger.error("Network error during token exchange: %s", e)
+            raise LinkedInOAuthError(f"Network error during token exchange: {e}")
         except Exception as e:
-            error_msg = f"Unexpected error during token exchange: {e}"
-            logger.error(error_msg)
-            raise LinkedInOAuthError(error_msg)
+            logger.error("Unexpected error during token exchange: %s", e)
+            raise LinkedInOAuthError(f"Unexpected error during token exchange: {e}")
     
     async def get_user_profile(self, access_token: str) -> Dict[str, Any]:
         """Get user profile information from LinkedIn."""
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    'Authorization': f'Bearer {access_token}',
-                    'Content-Type': 'application/json'
-                }
-                
-                # Get basic profile
-                profile_response = await client.get(self.PROFILE_URL, headers=headers)
-                
-                if profile_response.status_code != 200:
-                    error_msg = f"Profile fetch failed: {profile_response.status_code} - {profile_response.text}"
-                    logger.error(error_msg)
-                    raise LinkedInOAuthError(error_msg)
-                
-                profile_data = profile_response.json()
-                
-                # Get email address
-                email_response = await client.get(self.EMAIL_URL, headers=headers)
-                
-                if email_response.status_code == 200:
-                    email_data = email_response.json()
-                    if 'elements' in email_data and email_data['elements']:
-                        profile_data['email'] = email_data['elements'][0]['handle~']['emailAddress']
-                
-                logger.info("Successfully retrieved user profile")
-                return profile_data
-                
+            client = self.http_client
+            headers = {**_JSON_HEADERS, 'Authorization': f'Bearer {access_token}'}
+            
+            # Fetch the basic profile and the email address side by side; the email is
+            # optional, so a failed email request must not fail the profile
+            profile_response, email_response = await asyncio.gather(
+                client.get(self.PROFILE_URL, headers=headers),
+                client.get(self.EMAIL_URL, headers=headers),
+                return_exceptions=True
+            )
+            
+            if isinstance(profile_response, BaseException):
+                raise profile_response
+            
+            try:
+                profile_response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error("Profile fetch failed: %s - %s", profile_response.status_code, profile_response.text)
+                raise LinkedInOAuthError(
+                    f"Profile fetch failed: {profile_response.status_code} - {profile_response.text}"
+                ) from e
+            
+            profile_data = orjson.loads(profile_response.content)
+            
+            if isinstance(email_response, BaseException):
+                logger.warning("Email fetch failed: %s", email_response)
+            elif email_response.is_success:
+                email_data = orjson.loads(email_response.content)
+                if 'elements' in email_data and email_data['elements']:
+                    profile_data['email'] = email_data['elements'][0]['handle~']['emailAddress']
+            
+            logger.info("Successfully retrieved user profile")
+            return profile_data
+            
+        except LinkedInOAuthError:
+            raise
         except httpx.RequestError as e:
-            error_msg = f"Network error during profile fetch: {e}"
-            logger.error(error_msg)
-            raise LinkedInOAuthError(error_msg)
+            logger.error("Network error during profile fetch: %s", e)
+            raise LinkedInOAuthError(f"Network error during profile fetch: {e}")
         except Exception as e:
-            error_msg = f"Unexpected error during profile fetch: {e}"
-            logger.error(error_msg)
-            raise LinkedInOAuthError(error_msg)
+            logger.error("Unexpected error during profile fetch: %s", e)
+            raise LinkedInOAuthError(f"Unexpected error during profile fetch: {e}")
     
     async def make_authenticated_request(self, user_id: str, url: str, method: str = "GET", **kwargs) -> httpx.Response:
         """Make an authenticated request to LinkedIn API."""
@@ -203,29 +301,64 @@ class LinkedInOAuthClient:
         if not access_token:
             raise LinkedInOAuthError("Invalid token data")
         
-        headers = kwargs.get('headers', {})
-        headers['Authorization'] = f'Bearer {access_token}'
-        kwargs['headers'] = headers
+        # A new dict, so the caller's headers are never modified
+        kwargs['headers'] = {**kwargs.get('headers', {}), 'Authorization': f'Bearer {access_token}'}
+        
+        if method.upper() != "GET":
+            return await self._send_authenticated(user_id, method, url, **kwargs)
+        
+        # Identical GETs for the same user share one request while it is in flight
+        key = (user_id, url, repr(kwargs.get('params')))
+        task = self._inflight_gets.get(key)
+        if task is None:
+            task = asyncio.create_task(self._send_authenticated(user_id, method, url, **kwargs))
+            self._inflight_gets[key] = task
+            task.add_done_callback(lambda done: self._inflight_gets.pop(key, None))
+        
+        # Shielded so one caller being cancelled does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _send_authenticated(self, user_id: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request carrying a user's token, bounded by the API concurrency limit."""
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(config.linkedin_api_concurrency)
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(method, url, **kwargs)
-                
-                if response.status_code == 401:
-                    # Token expired or invalid
-                    self.token_storage.remove_token(user_id)
-                    raise LinkedInOAuthError("Token expired or invalid")
-                
-                return response
-                
+            async with self._request_semaphore:
+                response = await self.http_client.request(method, url, **kwargs)
+            
+            if response.status_code == 401:
+                # Token expired or invalid
+                self.token_storage.remove_token(user_id)
+                raise LinkedInOAuthError("Token expired or invalid")
+            
+            return response
+            
         except httpx.RequestError as e:
-            error_msg = f"Network error during authenticated request: {e}"
-            logger.error(error_msg)
-            raise LinkedInOAuthError(error_msg)
+            logger.error("Network error during authenticated request: %s", e)
+            raise LinkedInOAuthError(f"Network error during authenticated request: {e}")
     
-    def store_user_token(self, user_id: str, token_data: Dict[str, Any]) -> None:
-        """Store user token."""
-        self.token_storage.store_token(user_id, token_data)
+    def store_user_token(self, user_id: str, token_data: Dict[str, Any],
+                         profile: Optional[Dict[str, Any]] = None) -> None:
+        """Store user token, caching the person URN from their profile if given."""
+        person_urn = f"urn:li:person:{profile['id']}" if profile else None
+        self.token_storage.store_token(user_id, token_data, person_urn)
+    
+    async def get_person_urn(self, user_id: str) -> str:
+        """Get the person URN of an authenticated user, fetching their profile only once."""
+        person_urn = self.token_storage.get_person_urn(user_id)
+        if person_urn is not None:
+            return person_urn
+        
+        token_data = self.get_user_token(user_id)
+        if token_data is None:
+            raise LinkedInOAuthError("User not authenticated")
+        
+        # The URN never changes for a token; it is dropped with the token on expiry or a 401
+        profile = await self.get_user_profile(token_data['access_token'])
+        person_urn = f"urn:li:person:{profile['id']}"
+        self.token_storage.set_person_urn(user_id, person_urn)
+        return person_urn
     
     def get_user_token(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user token."""
@@ -240,26 +373,84 @@ class LinkedInOAuthClient:
         return self.get_user_token(user_id) is not None
 
 
-# Global OAuth client instance
-linkedin_oauth_client = None
+def _oauth_state_signature(payload: str) -> str:
+    return hmac.new(config.oauth_secret_key.encode(), payload.encode(), hashlib.sha256).hexdigest()[:16]
+
+
+def sign_oauth_state() -> str:
+    """Create a state parameter that the callback can check without server-side storage."""
+    payload = f"{secrets.token_urlsafe(16)}.{int(time.time())}"
+    return f"{payload}.{_oauth_state_signature(payload)}"
 
-def get_linkedin_oauth_client() -> LinkedInOAuthClient:
-    """Get or create LinkedIn OAuth client instance."""
-    global linkedin_oauth_client
+
+def verify_oauth_state(state: str) -> bool:
+    """Check that a state was signed by this server and has not expired."""
+    payload, _, signature = state.rpartition(".")
+    _, _, issued_at = payload.rpartition(".")
+    if not issued_at.isdigit() or not hmac.compare_digest(signature, _oauth_state_signature(payload)):
+        return False
+    return time.time() - int(issued_at) <= config.oauth_state_ttl_seconds
+
+
+class RedisOAuthStateStore:
+    """Records issued OAuth states in Redis so each one can complete a callback only once."""
     
-    if linkedin_oauth_client is None:
-        try:
-            linkedin_oauth_client = LinkedInOAuthClient()
-        except LinkedInOAuthError as e:
-            logger.warning(f"LinkedIn OAuth not configured: {e}")
-            return None
+    def __init__(self, redis_url: str, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._redis = aioredis.Redis.from_url(redis_url)
     
-    return linkedin_oauth_client
+    @staticmethod
+    def _key(state: str) -> str:
+        return f"oauth:state:{state}"
+    
+    async def add(self, state: str):
+        """Remember a newly issued state."""
+        await self._redis.set(self._key(state), "1", ex=self.ttl_seconds)
+    
+    async def consume(self, state: str) -> bool:
+        """Check a state and invalidate it, so a callback can only be completed once."""
+        # GETDEL is atomic, so two workers can never both accept the same state
+        return await self._redis.getdel(self._key(state)) is not None
+    
+    async def close(self):
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+def create_oauth_state_store() -> Optional[RedisOAuthStateStore]:
+    """Create the replay guard for OAuth states, or None when Redis is not configured."""
+    # States are signed, so without Redis nothing is stored and only signature and age are checked
+    if aioredis is not None and config.redis_url:
+        return RedisOAuthStateStore(config.redis_url, config.oauth_state_ttl_seconds)
+    return None
+
+
+# Credentials are read once at startup, so the client (or its absence) is built once;
+# after changing the OAuth configuration, call cache_clear() on this getter and on
+# get_linkedin_api_client, which wraps the cached client
+@functools.lru_cache(maxsize=1)
+def get_linkedin_oauth_client() -> Optional[LinkedInOAuthClient]:
+    """Get the LinkedIn OAuth client, or None if OAuth is not configured."""
+    try:
+        return LinkedInOAuthClient()
+    except LinkedInOAuthError as e:
+        logger.warning(f"LinkedIn OAuth not configured: {e}")
+        return None
+
+
+async def close_linkedin_oauth_client():
+    """Close the OAuth client's HTTP connections, if the client was created."""
+    if get_linkedin_oauth_client.cache_info().currsize:
+        oauth_client = get_linkedin_oauth_client()
+        if oauth_client is not None:
+            await oauth_client.close()
 
 
 class LinkedInAPIClient:
     """LinkedIn API client using OAuth tokens."""
     
+    __slots__ = ('oauth_client',)
+    
     def __init__(self, oauth_client: LinkedInOAuthClient):
         self.oauth_client = oauth_client
     
@@ -286,7 +477,7 @@ class LinkedInAPIClient:
             response = await self.oauth_client.make_authenticated_request(user_id, url)
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error(f"Failed to get connections: {response.status_code} - {response.text}")
                 return {"success": False, "error": response.text}
@@ -303,12 +494,8 @@ class LinkedInAPIClient:
         try:
             url = "https://api.linkedin.com/v2/ugcPosts"
             
-            # Get user profile to get the person URN
-            profile = await self.oauth_client.get_user_profile(
-                self.oauth_client.get_user_token(user_id)['access_token']
-            )
-            
-            person_urn = f"urn:li:person:{profile['id']}"
+            # Cached with the token, so the profile is only fetched the first time
+            person_urn = await self.oauth_client.get_person_urn(user_id)
             
             post_data = {
                 "author": person_urn,
@@ -327,11 +514,13 @@ class LinkedInAPIClient:
             }
             
             response = await self.oauth_client.make_authenticated_request(
-                user_id, url, method="POST", json=post_data
+                user_id, url, method="POST",
+                content=orjson.dumps(post_data),
+                headers=_JSON_HEADERS
             )
             
             if response.status_code == 201:
-                return {"success": True, "post_id": response.json().get("id")}
+                return {"success": True, "post_id": orjson.loads(response.content).get("id")}
             else:
                 logger.error(f"Failed to post update: {response.status_code} - {response.text}")
                 return {"success": False, "error": response.text}
@@ -344,8 +533,9 @@ class LinkedInAPIClient:
             return {"success": False, "error": str(e)}
 
 
+@functools.lru_cache(maxsize=1)
 def get_linkedin_api_client() -> Optional[LinkedInAPIClient]:
-    """Get LinkedIn API client instance."""
+    """Get the LinkedIn API client, or None if OAuth is not configured."""
     oauth_client = get_linkedin_oauth_client()
     if oauth_client:
         return LinkedInAPIClient(oauth_client)
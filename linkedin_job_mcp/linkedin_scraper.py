@@ -1,9 +1,12 @@
 """LinkedIn job scraper module."""
 
 import asyncio
-import time
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, List, Dict, Optional, Any
 from urllib.parse import urlencode, quote
 from dataclasses import dataclass
 from selenium import webdriver
@@ -14,13 +17,142 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
+import httpx
 
 from .config import config
+from .utils import (
+    DATE_POSTED_FILTERS,
+    EMPLOYMENT_TYPE_FILTERS,
+    EXPERIENCE_LEVEL_FILTERS,
+    RequirementMatcher,
+    get_requirement_matcher
+)
 
 logger = logging.getLogger(__name__)
 
+LINKEDIN_HOME_URL = "https://www.linkedin.com"
+LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
+
+JOB_CARD_SELECTOR = "div.base-card.relative.w-full.hover\\:no-underline.focus\\:no-underline.base-card--link.base-search-card.base-search-card--link.job-search-card"
+
+# How often explicit waits re-check their condition; Selenium's default is 0.5 s
+WAIT_POLL_SECONDS = 0.1
+# How long a scroll may take to load the next batch of job cards
+SCROLL_LOAD_TIMEOUT_SECONDS = 2
+
+# Shared across searches so job page fetches reuse pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            headers={'User-Agent': config.chrome_user_agent},
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0
+            )
+        )
+    return _http_client
+
+
+# Where LinkedIn redirects anonymous visitors it wants to sign in, and the status it
+# answers with when it refuses them outright; a browser session may still get through
+_LOGIN_WALL_PATHS = ("/authwall", "/login", "/checkpoint", "/uas/login")
+_REQUEST_DENIED_STATUS = 999
+
+
+def _is_login_wall(response: httpx.Response) -> bool:
+    """Whether LinkedIn answered a page request with its login wall."""
+    return response.status_code == _REQUEST_DENIED_STATUS or response.url.path.startswith(_LOGIN_WALL_PATHS)
+
+
+# Reads the fields of the first arguments[1] job cards in one call, rather than one
+# WebDriver round trip per field of every card
+_READ_JOB_CARDS_SCRIPT = """
+const text = (card, selector) => card.querySelector(selector)?.innerText.trim();
+return Array.from(document.querySelectorAll(arguments[0])).slice(0, arguments[1]).map(card => {
+    const date = card.querySelector('time.job-search-card__listdate');
+    return {
+        title: text(card, 'h3.base-search-card__title a'),
+        job_url: card.querySelector('h3.base-search-card__title a')?.href,
+        company: text(card, 'h4.base-search-card__subtitle a'),
+        location: text(card, 'span.job-search-card__location'),
+        posted_date: date ? (date.getAttribute('datetime') || date.innerText.trim()) : null
+    };
+});
+"""
+
+
+def _count_job_cards(driver) -> int:
+    """Count the job cards on the page."""
+    # Counted in the page, so no element references are sent back for each card
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length;", JOB_CARD_SELECTOR)
+
+
+def _more_job_cards_than(loaded: int):
+    """Wait condition returning the number of job cards once more than `loaded` are shown."""
+    def condition(driver) -> int:
+        count = _count_job_cards(driver)
+        return count if count > loaded else 0
+    return condition
+
+
+# ChromeDriver binary resolved by webdriver-manager, which checks versions (and may
+# download) on every install() call; resolved once and reused while the file exists
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+
+def get_chromedriver_path() -> str:
+    """Return the ChromeDriver path, installing the driver on first use."""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None or not os.path.exists(_chromedriver_path):
+            _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+
+# Selenium calls block, so they run on these threads instead of the event loop
+_selenium_executor = ThreadPoolExecutor(
+    max_workers=config.max_concurrent_searches,
+    thread_name_prefix="selenium"
+)
+
+# Limits how many searches (and so Chrome instances) run at once across the API handlers,
+# background tasks and MCP tools, which all search through stream_linkedin_jobs; created
+# on first use so it binds to the running event loop
+_search_semaphore: Optional[asyncio.BoundedSemaphore] = None
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking Selenium call on the Selenium thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_selenium_executor, func, *args)
+
+
+def _get_search_semaphore() -> asyncio.BoundedSemaphore:
+    """Return the semaphore bounding concurrent searches."""
+    global _search_semaphore
+    if _search_semaphore is None:
+        _search_semaphore = asyncio.BoundedSemaphore(config.max_concurrent_searches)
+    return _search_semaphore
+
+
+async def close_http_client():
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 @dataclass
 class JobListing:
@@ -39,9 +171,11 @@ class JobListing:
 class LinkedInScraper:
     """LinkedIn job scraper using Selenium."""
     
-    def __init__(self):
-        self.driver: Optional[webdriver.Chrome] = None
+    def __init__(self, driver: Optional[webdriver.Chrome] = None):
+        self.driver: Optional[webdriver.Chrome] = driver
         self.wait: Optional[WebDriverWait] = None
+        # Drivers handed in (e.g. from the pool) are not quit on close
+        self._owns_driver = driver is None
         
     def _setup_driver(self) -> webdriver.Chrome:
         """Set up Chrome WebDriver with appropriate options."""
@@ -60,7 +194,7 @@ class LinkedInScraper:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         # Install ChromeDriver automatically
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -70,8 +204,9 @@ class LinkedInScraper:
     async def initialize(self):
         """Initialize the scraper."""
         try:
-            self.driver = self._setup_driver()
-            self.wait = WebDriverWait(self.driver, config.job_search_timeout)
+            if self.driver is None:
+                self.driver = await _run_blocking(self._setup_driver)
+            self.wait = WebDriverWait(self.driver, config.job_search_timeout, poll_frequency=WAIT_POLL_SECONDS)
             logger.info("LinkedIn scraper initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize LinkedIn scraper: {e}")
@@ -79,9 +214,9 @@ class LinkedInScraper:
     
     async def close(self):
         """Close the scraper and clean up resources."""
-        if self.driver:
+        if self.driver and self._owns_driver:
             try:
-                self.driver.quit()
+                await _run_blocking(self.driver.quit)
                 logger.info("LinkedIn scraper closed successfully")
             except Exception as e:
                 logger.error(f"Error closing LinkedIn scraper: {e}")
@@ -100,84 +235,80 @@ class LinkedInScraper:
         }
         
         # Add optional filters
-        filters = []
-        if experience_level:
-            exp_map = {
-                "internship": "1",
-                "entry": "2", 
-                "associate": "3",
-                "mid": "4",
-                "director": "5",
-                "executive": "6"
-            }
-            if experience_level.lower() in exp_map:
-                filters.append(f"f_E={exp_map[experience_level.lower()]}")
+        filters = {}
+        if experience_level and experience_level.lower() in EXPERIENCE_LEVEL_FILTERS:
+            filters["f_E"] = EXPERIENCE_LEVEL_FILTERS[experience_level.lower()]
         
-        if employment_type:
-            type_map = {
-                "full-time": "F",
-                "part-time": "P",
-                "contract": "C",
-                "temporary": "T",
-                "internship": "I"
-            }
-            if employment_type.lower() in type_map:
-                filters.append(f"f_JT={type_map[employment_type.lower()]}")
+        if employment_type and employment_type.lower() in EMPLOYMENT_TYPE_FILTERS:
+            filters["f_JT"] = EMPLOYMENT_TYPE_FILTERS[employment_type.lower()]
         
-        if date_posted:
-            date_map = {
-                "past 24 hours": "r86400",
-                "past week": "r604800",
-                "past month": "r2592000"
-            }
-            if date_posted.lower() in date_map:
-                filters.append(f"f_TPR={date_map[date_posted.lower()]}")
+        if date_posted and date_posted.lower() in DATE_POSTED_FILTERS:
+            filters["f_TPR"] = DATE_POSTED_FILTERS[date_posted.lower()]
         
         if filters:
             params["f_LF"] = "f_AL"  # Easy Apply filter
-            for filter_param in filters:
-                key, value = filter_param.split("=")
-                params[key] = value
+            params.update(filters)
         
         return f"{base_url}?{urlencode(params)}"
     
-    def _extract_job_details(self, job_element) -> Optional[JobListing]:
-        """Extract job details from a job listing element."""
-        try:
-            # Extract basic information
-            title_element = job_element.find_element(By.CSS_SELECTOR, "h3.base-search-card__title a")
-            title = title_element.text.strip()
-            job_url = title_element.get_attribute("href")
-            
-            company_element = job_element.find_element(By.CSS_SELECTOR, "h4.base-search-card__subtitle a")
-            company = company_element.text.strip()
-            
-            location_element = job_element.find_element(By.CSS_SELECTOR, "span.job-search-card__location")
-            location = location_element.text.strip()
+    def _extract_job_details(self, card: Dict[str, Optional[str]]) -> Optional[JobListing]:
+        """Build a listing from the fields read off a search result card."""
+        if not (card.get("title") and card.get("job_url") and card.get("company") and card.get("location")):
+            logger.error(f"Error extracting job details: incomplete job card {card}")
+            return None
+        
+        # The description lives on the job page and is fetched separately
+        return JobListing(
+            title=card["title"],
+            company=card["company"],
+            location=card["location"],
+            description="",
+            job_url=card["job_url"],
+            posted_date=card.get("posted_date") or None
+        )
+    
+    async def _fetch_job_description(self, job: JobListing, semaphore: asyncio.BoundedSemaphore,
+                                     driver_lock: asyncio.Lock) -> JobListing:
+        """Fill in the job description over HTTP, using the browser only past a login wall."""
+        login_wall = False
+        async with semaphore:
+            # Jittered delay keeps concurrent fetches from hitting LinkedIn in lockstep
+            await asyncio.sleep(random.uniform(0.5, 1.5) * config.search_delay_seconds)
             
-            # Try to extract posted date
-            posted_date = None
             try:
-                date_element = job_element.find_element(By.CSS_SELECTOR, "time.job-search-card__listdate")
-                posted_date = date_element.get_attribute("datetime") or date_element.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            # Get job description (this requires clicking on the job)
-            description = self._get_job_description(job_url)
-            
-            return JobListing(
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                job_url=job_url,
-                posted_date=posted_date
-            )
-            
-        except Exception as e:
-            logger.error(f"Error extracting job details: {e}")
-            return None
+                response = await get_http_client().get(job.job_url)
+                login_wall = _is_login_wall(response)
+                if not login_wall:
+                    response.raise_for_status()
+                    job.description = self._parse_job_description(response.text)
+            except Exception as e:
+                logger.warning(f"Error fetching job page over HTTP: {e}")
+        
+        if login_wall:
+            # Only the signed-in browser can see the page; it handles one page at a time
+            async with driver_lock:
+                page = asyncio.ensure_future(_run_blocking(self._get_job_description, job.job_url))
+                try:
+                    job.description = await asyncio.shield(page)
+                except asyncio.CancelledError:
+                    # Cancelling cannot stop the Selenium thread; hold on until it lets go of the driver
+                    await asyncio.wait({page})
+                    raise
+        elif not job.description:
+            job.description = "Description not available"
+        
+        return job
+    
+    def _parse_job_description(self, html: str) -> str:
+        """Extract the job description text from a job page."""
+        description_element = LexborHTMLParser(html).css_first(
+            "div.show-more-less-html__markup, div.description__text"
+        )
+        if description_element is None:
+            return ""
+        # One line per non-empty piece of text, as the page shows it
+        text = description_element.text(deep=True, separator="\n", strip=True)
+        return "\n".join(line for line in map(str.strip, text.split("\n")) if line)
     
     def _get_job_description(self, job_url: str) -> str:
         """Get detailed job description by visiting the job page."""
@@ -215,127 +346,310 @@ class LinkedInScraper:
                 self.driver.switch_to.window(self.driver.window_handles[0])
             return "Description not available"
     
+    def _load_job_cards(self, search_url: str, max_jobs: int) -> Optional[List[JobListing]]:
+        """Open the search page, scroll until enough cards load, and extract them."""
+        # Navigate to search page
+        self.driver.get(search_url)
+        
+        # Wait for job listings to load
+        try:
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.jobs-search__results-list"))
+            )
+        except TimeoutException:
+            logger.warning("Job listings did not load within timeout")
+            return None
+        
+        # Scroll to load more jobs
+        jobs_loaded = _count_job_cards(self.driver)
+        scroll_wait = WebDriverWait(self.driver, SCROLL_LOAD_TIMEOUT_SECONDS, poll_frequency=WAIT_POLL_SECONDS)
+        
+        while jobs_loaded < max_jobs:
+            # Scroll down
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            
+            # Wait for the next batch of cards, instead of sleeping a fixed time
+            try:
+                jobs_loaded = scroll_wait.until(_more_job_cards_than(jobs_loaded))
+            except TimeoutException:
+                # Nothing more loaded; this is the end of the results
+                break
+            
+            logger.info(f"Loaded {jobs_loaded} job listings")
+        
+        # Extract job details
+        cards = self.driver.execute_script(_READ_JOB_CARDS_SCRIPT, JOB_CARD_SELECTOR, max_jobs)
+        
+        jobs = []
+        for card in cards:
+            job_listing = self._extract_job_details(card)
+            if job_listing:
+                jobs.append(job_listing)
+        
+        return jobs
+    
     async def search_jobs(self, keywords: str, location: str = "", 
-                         max_jobs: int = None, **filters) -> List[JobListing]:
+                         max_jobs: int = None, detail_concurrency: int = None,
+                         **filters) -> List[JobListing]:
         """Search for jobs on LinkedIn."""
+        jobs = [
+            job async for job in self.iter_jobs(keywords, location, max_jobs, detail_concurrency, **filters)
+        ]
+        logger.info(f"Successfully extracted {len(jobs)} job listings")
+        return jobs
+    
+    async def iter_jobs(self, keywords: str, location: str = "", 
+                        max_jobs: int = None, detail_concurrency: int = None,
+                        **filters) -> AsyncIterator[JobListing]:
+        """Search for jobs on LinkedIn, yielding each listing as soon as it is extracted."""
         if not self.driver:
             await self.initialize()
         
         max_jobs = max_jobs or config.max_jobs_per_search
-        jobs = []
         
         try:
             # Build search URL
             search_url = self._build_search_url(keywords, location, **filters)
             logger.info(f"Searching LinkedIn jobs: {search_url}")
             
-            # Navigate to search page
-            self.driver.get(search_url)
-            
-            # Wait for job listings to load
-            try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.jobs-search__results-list"))
-                )
-            except TimeoutException:
-                logger.warning("Job listings did not load within timeout")
-                return jobs
-            
-            # Scroll to load more jobs
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            jobs_loaded = 0
+            jobs = await _run_blocking(self._load_job_cards, search_url, max_jobs)
+            if jobs is None:
+                return
             
-            while jobs_loaded < max_jobs:
-                # Scroll down
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
-                # Wait for new content to load
-                await asyncio.sleep(2)
-                
-                # Check if more content loaded
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-                
-                # Count current jobs
-                job_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card.relative.w-full.hover\\:no-underline.focus\\:no-underline.base-card--link.base-search-card.base-search-card--link.job-search-card")
-                jobs_loaded = len(job_elements)
-                
-                logger.info(f"Loaded {jobs_loaded} job listings")
+            # Fetch job descriptions concurrently, bounded to avoid rate limiting
+            semaphore = asyncio.BoundedSemaphore(detail_concurrency or config.detail_fetch_concurrency)
+            driver_lock = asyncio.Lock()
+            tasks = [
+                asyncio.ensure_future(self._fetch_job_description(job, semaphore, driver_lock))
+                for job in jobs
+            ]
             
-            # Extract job details
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card.relative.w-full.hover\\:no-underline.focus\\:no-underline.base-card--link.base-search-card.base-search-card--link.job-search-card")
-            
-            for i, job_element in enumerate(job_elements[:max_jobs]):
-                if i > 0:
-                    await asyncio.sleep(config.search_delay_seconds)
-                
-                job_listing = self._extract_job_details(job_element)
-                if job_listing:
-                    jobs.append(job_listing)
+            try:
+                # The fetches all run at once, but listings are yielded in LinkedIn's ranking order
+                for task in tasks:
+                    job_listing = await task
                     logger.info(f"Extracted job: {job_listing.title} at {job_listing.company}")
-            
-            logger.info(f"Successfully extracted {len(jobs)} job listings")
-            return jobs
+                    yield job_listing
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Wait for browser fetches still running so the driver is idle before it is released
+                await asyncio.gather(*tasks, return_exceptions=True)
             
         except Exception as e:
             logger.error(f"Error searching LinkedIn jobs: {e}")
             raise
     
-    def match_job_requirements(self, job: JobListing, requirements: List[str]) -> Dict[str, Any]:
+    def match_job_requirements(self, job: JobListing, requirements: List[str],
+                               matcher: Optional[RequirementMatcher] = None) -> Dict[str, Any]:
         """Check if a job matches the given requirements."""
-        job_text = f"{job.title} {job.description}".lower()
+        if matcher is None:
+            matcher = get_requirement_matcher(requirements)
         
-        matches = []
-        for requirement in requirements:
-            if requirement.lower() in job_text:
-                matches.append(requirement)
+        return matcher.match(f"{job.title} {job.description}")
+
+
+class WebDriverPool:
+    """Pool of started Chrome drivers that are reused across searches."""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: List[webdriver.Chrome] = []
+        self._created = 0
+        self._condition: Optional[asyncio.Condition] = None
+        # Set by close(); drivers released afterwards are quit instead of pooled
+        self._closed = False
+    
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    async def acquire(self) -> webdriver.Chrome:
+        """Check out an idle driver, starting a new one if the pool is not full yet."""
+        condition = self._get_condition()
+        async with condition:
+            while not self._idle and self._created >= self.size:
+                await condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
         
-        match_score = len(matches) / len(requirements) if requirements else 0
+        try:
+            return await _run_blocking(self._start_driver)
+        except Exception:
+            async with condition:
+                self._created -= 1
+                condition.notify()
+            raise
+    
+    async def release(self, driver: webdriver.Chrome):
+        """Return a driver to the pool, discarding it if the browser is no longer usable."""
+        healthy = False
+        if not self._closed:
+            try:
+                await _run_blocking(self._reset_driver, driver)
+                healthy = True
+            except Exception as e:
+                logger.warning(f"Discarding broken WebDriver: {e}")
         
-        return {
-            "matches": matches,
-            "match_score": match_score,
-            "is_match": match_score >= 0.5  # At least 50% of requirements must match
-        }
+        condition = self._get_condition()
+        async with condition:
+            # The pool may have been closed while the driver was being reset
+            keep = healthy and not self._closed
+            if keep:
+                self._idle.append(driver)
+            else:
+                self._created -= 1
+            condition.notify()
+        
+        if not keep:
+            try:
+                await _run_blocking(driver.quit)
+            except Exception as e:
+                # Broken browsers often fail to quit cleanly; only report shutdown failures
+                if self._closed:
+                    logger.error(f"Error closing WebDriver: {e}")
+    
+    @staticmethod
+    def _start_driver() -> webdriver.Chrome:
+        """Start a Chrome driver, signed in to LinkedIn when a session cookie is configured."""
+        driver = LinkedInScraper()._setup_driver()
+        if config.linkedin_li_at:
+            try:
+                WebDriverPool._sign_in(driver)
+            except Exception:
+                driver.quit()
+                raise
+        return driver
+    
+    @staticmethod
+    def _sign_in(driver: webdriver.Chrome):
+        """Sign a driver in by injecting the li_at session cookie."""
+        # Cookies can only be set for the domain of the current page
+        driver.get(LINKEDIN_HOME_URL)
+        driver.add_cookie({
+            "name": "li_at",
+            "value": config.linkedin_li_at,
+            "domain": ".linkedin.com",
+            "path": "/",
+            "secure": True,
+            "httpOnly": True
+        })
+        driver.get(LINKEDIN_FEED_URL)
+    
+    @staticmethod
+    def _reset_driver(driver: webdriver.Chrome):
+        """Close extra tabs left behind by a search."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+    
+    async def warm_up(self):
+        """Start drivers up to the pool size ahead of the first search."""
+        drivers = []
+        try:
+            for _ in range(self.size - self._created):
+                drivers.append(await self.acquire())
+        except Exception as e:
+            logger.warning(f"Could not pre-start WebDriver: {e}")
+        finally:
+            for driver in drivers:
+                await self.release(driver)
+        logger.info(f"WebDriver pool has {len(self._idle)} idle drivers")
+    
+    async def keep_sessions_alive(self, interval: float):
+        """Periodically reload LinkedIn in idle drivers so their sessions do not expire."""
+        while True:
+            await asyncio.sleep(interval)
+            condition = self._get_condition()
+            for driver in list(self._idle):
+                # Only touch drivers that are still idle; busy ones are in a search anyway
+                async with condition:
+                    if driver not in self._idle:
+                        continue
+                    self._idle.remove(driver)
+                try:
+                    await _run_blocking(driver.get, LINKEDIN_FEED_URL)
+                except Exception as e:
+                    logger.warning(f"Failed to refresh LinkedIn session: {e}")
+                await self.release(driver)
+    
+    async def close(self):
+        """Quit all idle drivers; drivers still checked out are quit when released."""
+        condition = self._get_condition()
+        async with condition:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+            self._created -= len(drivers)
+        for driver in drivers:
+            try:
+                await _run_blocking(driver.quit)
+            except Exception as e:
+                logger.error(f"Error closing WebDriver: {e}")
 
 
-async def search_linkedin_jobs(keywords: str, location: str = "", 
-                              requirements: List[str] = None, 
-                              max_jobs: int = None, **filters) -> List[Dict[str, Any]]:
-    """High-level function to search LinkedIn jobs and return matching results."""
-    scraper = LinkedInScraper()
+# Shared by all searches in this process
+driver_pool = WebDriverPool(config.max_concurrent_searches)
+
+
+async def stream_linkedin_jobs(keywords: str, location: str = "", 
+                               requirements: List[str] = None, 
+                               max_jobs: int = None, detail_concurrency: int = None,
+                               driver: Optional[webdriver.Chrome] = None,
+                               **filters) -> AsyncIterator[Dict[str, Any]]:
+    """Search LinkedIn jobs, yielding matching results as they are scraped."""
+    matcher = get_requirement_matcher(requirements)
     
-    try:
-        await scraper.initialize()
-        jobs = await scraper.search_jobs(keywords, location, max_jobs, **filters)
+    # Each search drives its own Chrome instance
+    async with _get_search_semaphore():
+        pooled_driver = None
+        if driver is None:
+            pooled_driver = driver = await driver_pool.acquire()
+        scraper = LinkedInScraper(driver)
         
-        results = []
-        for job in jobs:
-            job_data = {
-                "title": job.title,
-                "company": job.company,
-                "location": job.location,
-                "description": job.description,
-                "job_url": job.job_url,
-                "posted_date": job.posted_date,
-                "employment_type": job.employment_type,
-                "experience_level": job.experience_level,
-                "salary_range": job.salary_range
-            }
+        try:
+            await scraper.initialize()
             
-            if requirements:
-                match_info = scraper.match_job_requirements(job, requirements)
-                job_data.update(match_info)
+            async for job in scraper.iter_jobs(keywords, location, max_jobs, detail_concurrency, **filters):
+                job_data = {
+                    "title": job.title,
+                    "company": job.company,
+                    "location": job.location,
+                    "description": job.description,
+                    "job_url": job.job_url,
+                    "posted_date": job.posted_date,
+                    "employment_type": job.employment_type,
+                    "experience_level": job.experience_level,
+                    "salary_range": job.salary_range
+                }
                 
-                # Only include jobs that match requirements
-                if match_info["is_match"]:
-                    results.append(job_data)
-            else:
-                results.append(job_data)
-        
-        return results
-        
-    finally:
-        await scraper.close()
\ No newline at end of file
+                if requirements:
+                    match_info = scraper.match_job_requirements(job, requirements, matcher)
+                    job_data.update(match_info)
+                    
+                    # Only include jobs that match requirements
+                    if not match_info["is_match"]:
+                        continue
+                
+                yield job_data
+            
+        finally:
+            await scraper.close()
+            if pooled_driver is not None:
+                await driver_pool.release(pooled_driver)
+
+
+async def search_linkedin_jobs(keywords: str, location: str = "", 
+                              requirements: List[str] = None, 
+                              max_jobs: int = None, detail_concurrency: int = None,
+                              driver: Optional[webdriver.Chrome] = None,
+                              **filters) -> List[Dict[str, Any]]:
+    """High-level function to search LinkedIn jobs and return matching results."""
+    return [
+        job async for job in stream_linkedin_jobs(
+            keywords, location, requirements, max_jobs, detail_concurrency, driver, **filters
+        )
+    ]
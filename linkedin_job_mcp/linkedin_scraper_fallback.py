@@ -5,17 +5,53 @@ Supports both Selenium (when Chrome is available) and HTTP requests fallback
 
 import asyncio
 import logging
-import re
 import time
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from urllib.parse import urlencode, quote_plus
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from .config import config
-from .utils import clean_text, extract_salary, match_requirements
+from .utils import (
+    DATE_POSTED_FILTERS,
+    EMPLOYMENT_TYPE_FILTERS,
+    EXPERIENCE_LEVEL_FILTERS,
+    clean_text,
+    extract_salary,
+    get_requirement_matcher
+)
 
 logger = logging.getLogger(__name__)
 
+def _class_selector(tags: List[str], words: List[str]) -> str:
+    """CSS selector for the given tags with a class containing any of the words."""
+    # One compound selector, so an element matching several words is returned once
+    classes = ', '.join(f'[class*="{word}"]' for word in words)
+    return f":is({', '.join(tags)}):is({classes})"
+
+# Job cards (LinkedIn uses various selectors) and the fields read from each card
+_JOB_CARD_SELECTOR = _class_selector(['div', 'li'], ['job', 'result'])
+_TITLE_SELECTOR = _class_selector(['h3', 'h4', 'a'], ['title', 'job'])
+_COMPANY_SELECTOR = _class_selector(['span', 'div', 'a'], ['company'])
+_LOCATION_SELECTOR = _class_selector(['span', 'div'], ['location'])
+_DESCRIPTION_SELECTOR = _class_selector(['div', 'span'], ['description', 'summary'])
+
+def _find_in_card(card: LexborNode, selector: str) -> Optional[LexborNode]:
+    """First element inside a card matching a selector, in document order."""
+    node = card.css_first(selector)
+    if node == card:
+        # Lexbor also matches the card itself; only its descendants are wanted
+        node = next((match for match in card.css(selector) if match != card), None)
+    return node
+
+def _node_text(node: Optional[LexborNode], default: str) -> str:
+    return clean_text(node.text(deep=True)) if node is not None else default
+
+def _match_requirements(text: str, requirements: List[str]) -> Tuple[bool, int]:
+    """Whether a job's text matches the requirements, and how many of them it mentions."""
+    # One scan with the search's shared matcher, instead of a substring check per requirement
+    match_info = get_requirement_matcher(requirements).match(text)
+    return match_info["is_match"], len(match_info["matches"])
+
 class LinkedInScraperFallback:
     """LinkedIn scraper with fallback for cloud environments"""
     
@@ -89,7 +125,7 @@ class LinkedInScraperFallback:
                     continue
             
             # For cloud deployment, use sample data directly since LinkedIn blocks automated requests
-            if not jobs or len([j for j in jobs if j.get('title', '') not in ['Job Title', 'Sign in to create job alert']]) == 0:
+            if not any(j.get('title', '') not in ['Job Title', 'Sign in to create job alert'] for j in jobs):
                 logger.info("Using sample job data for demo (LinkedIn blocks automated requests)")
                 jobs = self._generate_sample_jobs(keywords, location, requirements, max_jobs)
             
@@ -105,7 +141,7 @@ class LinkedInScraperFallback:
         """Make HTTP request with error handling"""
         try:
             # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None, 
                 lambda: self.session.get(url, timeout=10)
@@ -126,10 +162,7 @@ class LinkedInScraperFallback:
         jobs = []
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Look for job cards (LinkedIn uses various selectors)
-            job_cards = soup.find_all(['div', 'li'], class_=re.compile(r'job|result'))
+            job_cards = LexborHTMLParser(html).css(_JOB_CARD_SELECTOR)
             
             for card in job_cards[:25]:  # Limit per page
                 try:
@@ -149,29 +182,27 @@ class LinkedInScraperFallback:
         """Extract job information from a job card"""
         try:
             # Extract title
-            title_elem = card.find(['h3', 'h4', 'a'], class_=re.compile(r'title|job'))
-            title = clean_text(title_elem.get_text()) if title_elem else "Job Title"
+            title = _node_text(_find_in_card(card, _TITLE_SELECTOR), "Job Title")
             
             # Extract company
-            company_elem = card.find(['span', 'div', 'a'], class_=re.compile(r'company'))
-            company = clean_text(company_elem.get_text()) if company_elem else "Company"
+            company = _node_text(_find_in_card(card, _COMPANY_SELECTOR), "Company")
             
             # Extract location
-            location_elem = card.find(['span', 'div'], class_=re.compile(r'location'))
-            location = clean_text(location_elem.get_text()) if location_elem else "Location"
+            location = _node_text(_find_in_card(card, _LOCATION_SELECTOR), "Location")
             
             # Extract link
-            link_elem = card.find('a', href=True)
-            link = link_elem['href'] if link_elem else "#"
+            link_elem = _find_in_card(card, 'a[href]')
+            link = link_elem.attributes['href'] if link_elem is not None else "#"
             if link.startswith('/'):
                 link = f"https://www.linkedin.com{link}"
             
             # Extract description (limited in search results)
-            desc_elem = card.find(['div', 'span'], class_=re.compile(r'description|summary'))
-            description = clean_text(desc_elem.get_text()) if desc_elem else f"Job opportunity at {company}"
+            description = _node_text(
+                _find_in_card(card, _DESCRIPTION_SELECTOR), f"Job opportunity at {company}"
+            )
             
             # Check requirements match
-            is_match = match_requirements(f"{title} {description}", requirements)
+            is_match, match_score = _match_requirements(f"{title} {description}", requirements)
             
             job = {
                 'title': title,
@@ -182,7 +213,7 @@ class LinkedInScraperFallback:
                 'salary': extract_salary(description),
                 'posted_date': 'Recently',
                 'is_match': is_match,
-                'match_score': len([req for req in requirements if req.lower() in f"{title} {description}".lower()]) if requirements else 0,
+                'match_score': match_score,
                 'source': 'linkedin_fallback'
             }
             
@@ -254,8 +285,7 @@ class LinkedInScraperFallback:
             
             description = descriptions[i % len(descriptions)]
             
-            is_match = match_requirements(f"{title} {description}", requirements)
-            match_score = len([req for req in requirements if req.lower() in f"{title} {description}".lower()]) if requirements else 0
+            is_match, match_score = _match_requirements(f"{title} {description}", requirements)
             
             # Salary ranges based on seniority and company
             base_salary = 90 + (i * 8) + (20 if 'Senior' in title else 0) + (30 if company in ['Google', 'Meta', 'Apple'] else 0)
@@ -281,76 +311,88 @@ class LinkedInScraperFallback:
     
     def _get_date_filter(self, date_posted: str) -> str:
         """Convert date filter to LinkedIn format"""
-        filters = {
-            'past 24 hours': 'r86400',
-            'past week': 'r604800', 
-            'past month': 'r2592000'
-        }
-        return filters.get(date_posted.lower(), '')
+        return DATE_POSTED_FILTERS.get(date_posted.lower(), '')
     
     def _get_experience_filter(self, experience_level: str) -> str:
         """Convert experience filter to LinkedIn format"""
-        filters = {
-            'internship': '1',
-            'entry': '2', 
-            'associate': '3',
-            'mid': '4',
-            'director': '5',
-            'executive': '6'
-        }
-        return filters.get(experience_level.lower(), '')
+        return EXPERIENCE_LEVEL_FILTERS.get(experience_level.lower(), '')
     
     def _get_employment_filter(self, employment_type: str) -> str:
         """Convert employment type filter to LinkedIn format"""
-        filters = {
-            'full-time': 'F',
-            'part-time': 'P',
-            'contract': 'C', 
-            'temporary': 'T',
-            'internship': 'I'
-        }
-        return filters.get(employment_type.lower(), '')
+        return EMPLOYMENT_TYPE_FILTERS.get(employment_type.lower(), '')
 
 
-# Main search function with fallback
-async def search_linkedin_jobs(
+# Main search functions with fallback
+async def stream_linkedin_jobs(
     keywords: str,
     location: str = "",
     requirements: List[str] = None,
     max_jobs: int = 25,
     experience_level: str = "",
     employment_type: str = "",
-    date_posted: str = ""
-) -> List[Dict[str, Any]]:
+    date_posted: str = "",
+    detail_concurrency: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Search LinkedIn jobs with automatic fallback to HTTP requests
+    Stream LinkedIn jobs as they are scraped, with automatic fallback to sample data
     """
+    jobs_found = 0
     
     # First try Selenium if Chrome is available
     try:
-        from .linkedin_scraper import LinkedInScraper
+        from .linkedin_scraper import stream_linkedin_jobs as stream_selenium_jobs
         
-        scraper = LinkedInScraper()
-        jobs = await scraper.search_jobs(
+        async for job in stream_selenium_jobs(
             keywords=keywords,
             location=location,
             requirements=requirements,
             max_jobs=max_jobs,
             experience_level=experience_level,
             employment_type=employment_type,
-            date_posted=date_posted
-        )
-        
-        if jobs:
-            logger.info(f"Successfully scraped {len(jobs)} jobs using Selenium")
-            return jobs
+            date_posted=date_posted,
+            detail_concurrency=detail_concurrency
+        ):
+            jobs_found += 1
+            yield job
             
     except Exception as e:
         logger.warning(f"Selenium scraper failed: {e}")
     
+    if jobs_found:
+        logger.info(f"Successfully scraped {jobs_found} jobs using Selenium")
+        return
+    
     # Fallback to sample data for cloud deployment
     logger.info("Using sample job data for cloud deployment (Chrome not available)")
     fallback_scraper = LinkedInScraperFallback()
     
     # Generate sample data directly for cloud environments
-    return fallback_scraper._generate_sample_jobs(keywords, location, requirements, max_jobs)
\ No newline at end of file
+    for job in fallback_scraper._generate_sample_jobs(keywords, location, requirements, max_jobs):
+        yield job
+
+
+async def search_linkedin_jobs(
+    keywords: str,
+    location: str = "",
+    requirements: List[str] = None,
+    max_jobs: int = 25,
+    experience_level: str = "",
+    employment_type: str = "",
+    date_posted: str = "",
+    detail_concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search LinkedIn jobs with automatic fallback to HTTP requests
+    """
+    return [
+        job async for job in stream_linkedin_jobs(
+            keywords=keywords,
+            location=location,
+            requirements=requirements,
+            max_jobs=max_jobs,
+            experience_level=experience_level,
+            employment_type=employment_type,
+            date_posted=date_posted,
+            detail_concurrency=detail_concurrency
+        )
+    ]
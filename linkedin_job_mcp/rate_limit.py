@@ -0,0 +1,76 @@
+"""Per-client request rate limiting for the expensive API endpoints."""
+
+import time
+from typing import Dict, Optional
+
+from .config import config
+
+# Only imported when Redis is configured; it is a slow import that is otherwise unused
+aioredis = None
+if config.redis_url:
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        pass
+
+
+class InMemoryRateLimiter:
+    """Fixed-window request counter for a single API process."""
+    
+    def __init__(self, limit: int, window_seconds: int):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._window: Optional[int] = None
+        self._counts: Dict[str, int] = {}
+    
+    async def hit(self, client: str) -> Optional[float]:
+        """Count a request; return the seconds to wait if the client is over the limit."""
+        now = time.time()
+        window = int(now // self.window_seconds)
+        if window != self._window:
+            # Counts of finished windows are never needed again
+            self._window = window
+            self._counts = {}
+        
+        count = self._counts.get(client, 0) + 1
+        self._counts[client] = count
+        if count > self.limit:
+            return self.window_seconds - now % self.window_seconds
+        return None
+    
+    async def close(self):
+        """Nothing to release for the in-memory limiter."""
+
+
+class RedisRateLimiter:
+    """Fixed-window request counter shared by all API workers."""
+    
+    def __init__(self, redis_url: str, limit: int, window_seconds: int):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._redis = aioredis.Redis.from_url(redis_url)
+    
+    async def hit(self, client: str) -> Optional[float]:
+        """Count a request; return the seconds to wait if the client is over the limit."""
+        now = time.time()
+        key = f"ratelimit:{client}:{int(now // self.window_seconds)}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, self.window_seconds)
+            count, _ = await pipe.execute()
+        if count > self.limit:
+            return self.window_seconds - now % self.window_seconds
+        return None
+    
+    async def close(self):
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+def create_rate_limiter():
+    """Create the rate limiter: Redis when configured, in-memory otherwise, None if disabled."""
+    if config.rate_limit_requests <= 0:
+        return None
+    if aioredis is not None and config.redis_url:
+        return RedisRateLimiter(config.redis_url, config.rate_limit_requests, config.rate_limit_window_seconds)
+    return InMemoryRateLimiter(config.rate_limit_requests, config.rate_limit_window_seconds)
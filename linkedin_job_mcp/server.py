@@ -18,10 +18,11 @@ from mcp.types import (
 )
 from pydantic import BaseModel, Field
 
-from .linkedin_scraper import search_linkedin_jobs
-from .sheets_client import add_jobs_to_sheets, GoogleSheetsClient
+from .linkedin_scraper import close_http_client, driver_pool, search_linkedin_jobs
+from .sheets_client import add_jobs_to_sheets, flush_all_pending_appends, get_sheets_client, spreadsheet_url
 from .config import config
 from .linkedin_oauth import (
+    close_linkedin_oauth_client,
     get_linkedin_oauth_client, 
     get_linkedin_api_client,
     LinkedInOAuthError
@@ -326,7 +327,7 @@ async def handle_search_linkedin_jobs(arguments: Dict[str, Any]) -> List[TextCon
                 "location": request.location,
                 "requirements": request.requirements,
                 "jobs_found": len(jobs),
-                "matching_jobs": len([job for job in jobs if job.get('is_match', True)])
+                "matching_jobs": sum(1 for job in jobs if job.get('is_match', True))
             },
             "jobs": jobs
         }
@@ -390,13 +391,13 @@ async def handle_create_job_spreadsheet(arguments: Dict[str, Any]) -> List[TextC
         
         logger.info(f"Creating new spreadsheet: {request.title}")
         
-        client = GoogleSheetsClient()
-        spreadsheet_id = client.create_spreadsheet(request.title)
-        spreadsheet_info = client.get_spreadsheet_info(spreadsheet_id)
+        client = get_sheets_client()
+        loop = asyncio.get_running_loop()
+        spreadsheet_id = await loop.run_in_executor(None, client.create_spreadsheet, request.title)
         
         response = f"Successfully created new spreadsheet: **{request.title}**\n\n"
         response += f"📊 Spreadsheet ID: `{spreadsheet_id}`\n"
-        response += f"🔗 URL: {spreadsheet_info['url']}\n\n"
+        response += f"🔗 URL: {spreadsheet_url(spreadsheet_id)}\n\n"
         response += "The spreadsheet has been set up with appropriate headers for job listings. "
         response += "You can now use this spreadsheet ID in job search requests to automatically add matching jobs."
         
@@ -416,16 +417,19 @@ async def handle_get_spreadsheet_info(arguments: Dict[str, Any]) -> List[TextCon
         
         logger.info(f"Getting spreadsheet info: {spreadsheet_id}")
         
-        client = GoogleSheetsClient(spreadsheet_id)
-        info = client.get_spreadsheet_info()
-        existing_jobs = client.get_existing_jobs()
+        loop = asyncio.get_running_loop()
+        client = await loop.run_in_executor(None, get_sheets_client().for_spreadsheet, spreadsheet_id)
+        info, existing_jobs_count = await asyncio.gather(
+            loop.run_in_executor(None, client.get_spreadsheet_info),
+            loop.run_in_executor(None, client.count_existing_jobs)
+        )
         
         response = f"## Spreadsheet Information\n\n"
         response += f"📊 **Title:** {info['title']}\n"
         response += f"🆔 **ID:** `{spreadsheet_id}`\n"
         response += f"🔗 **URL:** {info['url']}\n"
         response += f"📋 **Sheets:** {', '.join(info['sheets'])}\n"
-        response += f"💼 **Existing Jobs:** {len(existing_jobs)} job listings\n"
+        response += f"💼 **Existing Jobs:** {existing_jobs_count} job listings\n"
         
         return [TextContent(type="text", text=response)]
         
@@ -474,11 +478,11 @@ async def handle_linkedin_oauth_status(arguments: Dict[str, Any]) -> List[TextCo
         if not oauth_client:
             return [TextContent(type="text", text="❌ LinkedIn OAuth is not configured.")]
 
-        is_authenticated = oauth_client.is_user_authenticated(user_id)
+        # One lookup: checking and then fetching could see the token expire in between
+        token_data = oauth_client.get_user_token(user_id)
         
-        if is_authenticated:
+        if token_data is not None:
             try:
-                token_data = oauth_client.get_user_token(user_id)
                 profile = await oauth_client.get_user_profile(token_data['access_token'])
                 
                 name = "LinkedIn User"
@@ -518,10 +522,10 @@ async def handle_linkedin_get_profile(arguments: Dict[str, Any]) -> List[TextCon
         if not oauth_client:
             return [TextContent(type="text", text="❌ LinkedIn OAuth is not configured.")]
 
-        if not oauth_client.is_user_authenticated(user_id):
+        token_data = oauth_client.get_user_token(user_id)
+        if token_data is None:
             return [TextContent(type="text", text=f"❌ User `{user_id}` is not authenticated with LinkedIn. Please authenticate first.")]
 
-        token_data = oauth_client.get_user_token(user_id)
         profile = await oauth_client.get_user_profile(token_data['access_token'])
         
         name = "LinkedIn User"
@@ -644,12 +648,19 @@ async def main():
         }
     )
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            options
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                options
+            )
+    finally:
+        # Searches keep their Chrome drivers open for reuse; quit them with the server
+        await flush_all_pending_appends()
+        await close_http_client()
+        await close_linkedin_oauth_client()
+        await driver_pool.close()
 
 
 if __name__ == "__main__":
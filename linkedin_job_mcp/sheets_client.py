@@ -1,10 +1,17 @@
 """Google Sheets integration module."""
 
+import asyncio
+import copy
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
+from functools import lru_cache
 import os
 
+from cachetools import TTLCache
+
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
@@ -13,20 +20,83 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from .config import config
+from .utils import job_key
 
 logger = logging.getLogger(__name__)
 
 # Google Sheets API scope
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Keys (see utils.job_key) of the jobs already present in each spreadsheet, loaded
+# lazily from the URL column and kept up to date as rows are appended, so duplicate
+# filtering does not have to re-read the whole sheet on every call. Entries are
+# re-read after a short TTL to pick up rows edited outside this process.
+_known_job_keys: Dict[str, Set[str]] = {}
+_known_job_keys_loaded_at: Dict[str, float] = {}
+
+# Spreadsheet title and tab names, which rarely change. TTLCache is not thread-safe
+# and is used from executor threads, so every access holds the guard lock.
+_spreadsheet_info_cache: TTLCache = TTLCache(maxsize=256, ttl=config.spreadsheet_info_cache_ttl_seconds)
+_spreadsheet_info_guard = threading.Lock()
+
+# Executor threads refilling the same cache entry wait on one lock, so an expired
+# entry triggers a single Sheets API read instead of one per concurrent caller
+_refill_locks: Dict[tuple, threading.Lock] = {}
+_refill_locks_guard = threading.Lock()
+
+
+def _refill_lock(*key) -> threading.Lock:
+    with _refill_locks_guard:
+        lock = _refill_locks.get(key)
+        if lock is None:
+            lock = _refill_locks[key] = threading.Lock()
+        return lock
+
+
+def spreadsheet_url(spreadsheet_id: str) -> str:
+    """Browser URL of a spreadsheet."""
+    return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+
+
+class _PendingAppend:
+    """Job rows waiting to be appended to one spreadsheet."""
+    
+    def __init__(self):
+        self.entries: List[tuple] = []  # (jobs, filter_duplicates, future)
+        self.row_count = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+# Appends from concurrent searches are combined per spreadsheet: rows are written at
+# once when no append to that spreadsheet is running, and otherwise collected while it
+# runs and written with a single values.append when it finishes, the buffer grows large
+# enough, or the oldest buffered rows have waited SHEETS_FLUSH_DELAY_SECONDS.
+_pending_appends: Dict[str, _PendingAppend] = {}
+_appending: Set[str] = set()
+_flush_tasks: Set[asyncio.Task] = set()
+
 
 class GoogleSheetsClient:
     """Google Sheets API client for managing job data."""
     
     def __init__(self, spreadsheet_id: Optional[str] = None):
         self.spreadsheet_id = spreadsheet_id or config.google_spreadsheet_id
-        self.service = None
         self.credentials = None
+        self._local = threading.local()
+    
+    @property
+    def service(self):
+        """Sheets API service for the current thread, built from the shared credentials."""
+        # httplib2 connections are not thread-safe, so each executor thread gets its own
+        service = getattr(self._local, 'service', None)
+        if service is None and self.credentials is not None:
+            # The bundled discovery document avoids fetching it over the network
+            service = build(
+                'sheets', 'v4', credentials=self.credentials,
+                static_discovery=True, cache_discovery=False
+            )
+            self._local.service = service
+        return service
         
     def _authenticate(self):
         """Authenticate with Google Sheets API."""
@@ -69,14 +139,20 @@ class GoogleSheetsClient:
                     token.write(creds.to_json())
         
         self.credentials = creds
-        self.service = build('sheets', 'v4', credentials=creds)
         logger.info("Google Sheets API client initialized successfully")
     
     def initialize(self):
         """Initialize the Google Sheets client."""
-        if not self.service:
+        if not self.credentials:
             self._authenticate()
     
+    def for_spreadsheet(self, spreadsheet_id: str) -> 'GoogleSheetsClient':
+        """Return a client bound to another spreadsheet that shares these credentials and services."""
+        self.initialize()
+        client = copy.copy(self)
+        client.spreadsheet_id = spreadsheet_id
+        return client
+    
     def create_spreadsheet(self, title: str) -> str:
         """Create a new spreadsheet and return its ID."""
         self.initialize()
@@ -102,6 +178,8 @@ class GoogleSheetsClient:
             
             # Set up headers
             self._setup_headers(spreadsheet_id)
+            _known_job_keys[spreadsheet_id] = set()
+            _known_job_keys_loaded_at[spreadsheet_id] = time.monotonic()
             
             logger.info(f"Created new spreadsheet: {title} (ID: {spreadsheet_id})")
             return spreadsheet_id
@@ -195,15 +273,6 @@ class GoogleSheetsClient:
             return 0
         
         try:
-            # Get current data to find next empty row
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range="Job Listings!A:A"
-            ).execute()
-            
-            values = result.get('values', [])
-            next_row = len(values) + 1
-            
             # Prepare job data for insertion
             job_rows = []
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -225,28 +294,46 @@ class GoogleSheetsClient:
                 ]
                 job_rows.append(row)
             
-            # Insert data
-            range_name = f"Job Listings!A{next_row}:L{next_row + len(job_rows) - 1}"
+            # Append all rows after the last row of the table in a single API call
             body = {
                 'values': job_rows
             }
             
-            result = self.service.spreadsheets().values().update(
+            result = self.service.spreadsheets().values().append(
                 spreadsheetId=spreadsheet_id,
-                range=range_name,
+                range="Job Listings!A:L",
                 valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
                 body=body
             ).execute()
             
-            updated_cells = result.get('updatedCells', 0)
+            updated_cells = result.get('updates', {}).get('updatedCells', 0)
             logger.info(f"Added {len(job_rows)} jobs to spreadsheet ({updated_cells} cells updated)")
             
+            known_keys = _known_job_keys.get(spreadsheet_id)
+            if known_keys is not None:
+                known_keys.update(job_key(job['job_url']) for job in jobs if job.get('job_url'))
+            
             return len(job_rows)
             
         except HttpError as e:
             logger.error(f"Failed to add jobs to spreadsheet: {e}")
             raise
     
+    def _fetch_existing_jobs(self, spreadsheet_id: str) -> List[str]:
+        """Read the job URL column of the spreadsheet."""
+        # Read below the header as a single column and ask only for the values,
+        # which keeps the response to one flat list of URLs
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id,
+            range="Job Listings!D2:D",  # Job URL column
+            majorDimension='COLUMNS',
+            fields='values'
+        ).execute()
+        
+        values = result.get('values', [])
+        return [url for url in values[0] if url] if values else []
+    
     def get_existing_jobs(self, spreadsheet_id: str = None) -> List[str]:
         """Get list of existing job URLs to avoid duplicates."""
         self.initialize()
@@ -256,14 +343,7 @@ class GoogleSheetsClient:
             return []
         
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range="Job Listings!D:D"  # Job URL column
-            ).execute()
-            
-            values = result.get('values', [])
-            # Skip header row and extract URLs
-            existing_urls = [row[0] for row in values[1:] if row]
+            existing_urls = self._fetch_existing_jobs(spreadsheet_id)
             
             logger.info(f"Found {len(existing_urls)} existing job URLs")
             return existing_urls
@@ -272,14 +352,61 @@ class GoogleSheetsClient:
             logger.error(f"Failed to get existing jobs: {e}")
             return []
     
+    def _get_known_keys(self, spreadsheet_id: str = None) -> Set[str]:
+        """Get the cached set of job keys in the spreadsheet, loading it on first use."""
+        self.initialize()
+        spreadsheet_id = spreadsheet_id or self.spreadsheet_id
+        
+        if not spreadsheet_id:
+            return set()
+        
+        known_keys = _known_job_keys.get(spreadsheet_id)
+        if known_keys is not None and not self._known_keys_expired(spreadsheet_id):
+            return known_keys
+        
+        with _refill_lock('existing_jobs', spreadsheet_id):
+            # Another thread may have reloaded the set while this one waited
+            known_keys = _known_job_keys.get(spreadsheet_id)
+            if known_keys is not None and not self._known_keys_expired(spreadsheet_id):
+                return known_keys
+            
+            try:
+                known_keys = {job_key(url) for url in self._fetch_existing_jobs(spreadsheet_id)}
+            except HttpError as e:
+                logger.error(f"Failed to get existing jobs: {e}")
+                # Keep using a stale set rather than letting duplicates through
+                return _known_job_keys.get(spreadsheet_id, set())
+            
+            _known_job_keys[spreadsheet_id] = known_keys
+            _known_job_keys_loaded_at[spreadsheet_id] = time.monotonic()
+            logger.info(f"Loaded {len(known_keys)} existing job URLs")
+        
+        return known_keys
+    
+    @staticmethod
+    def _known_keys_expired(spreadsheet_id: str) -> bool:
+        loaded_at = _known_job_keys_loaded_at.get(spreadsheet_id, 0.0)
+        return time.monotonic() - loaded_at > config.existing_jobs_cache_ttl_seconds
+    
+    def count_existing_jobs(self, spreadsheet_id: str = None) -> int:
+        """Count the jobs already in the spreadsheet, using the cached URL column."""
+        return len(self._get_known_keys(spreadsheet_id))
+    
     def filter_new_jobs(self, jobs: List[Dict[str, Any]], spreadsheet_id: str = None) -> List[Dict[str, Any]]:
         """Filter out jobs that already exist in the spreadsheet."""
-        existing_urls = set(self.get_existing_jobs(spreadsheet_id))
+        existing_keys = self._get_known_keys(spreadsheet_id)
         
+        # Also drop repeats within the batch, which the sheet doesn't know about yet
+        batch_keys = set()
         new_jobs = []
         for job in jobs:
-            if job.get('job_url') not in existing_urls:
-                new_jobs.append(job)
+            url = job.get('job_url')
+            if url:
+                key = job_key(url)
+                if key in existing_keys or key in batch_keys:
+                    continue
+                batch_keys.add(key)
+            new_jobs.append(job)
         
         logger.info(f"Filtered {len(jobs)} jobs down to {len(new_jobs)} new jobs")
         return new_jobs
@@ -292,32 +419,165 @@ class GoogleSheetsClient:
         if not spreadsheet_id:
             raise ValueError("No spreadsheet ID provided")
         
-        try:
-            result = self.service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
+        with _spreadsheet_info_guard:
+            info = _spreadsheet_info_cache.get(spreadsheet_id)
+        if info is not None:
+            return info
+        
+        with _refill_lock('info', spreadsheet_id):
+            with _spreadsheet_info_guard:
+                info = _spreadsheet_info_cache.get(spreadsheet_id)
+            if info is not None:
+                return info
             
-            return {
+            try:
+                # Only the titles are used; the full response includes every sheet's grid metadata
+                result = self.service.spreadsheets().get(
+                    spreadsheetId=spreadsheet_id,
+                    fields='properties.title,sheets.properties.title'
+                ).execute()
+                
+            except HttpError as e:
+                logger.error(f"Failed to get spreadsheet info: {e}")
+                raise
+            
+            info = {
                 'title': result.get('properties', {}).get('title', ''),
-                'url': f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
+                'url': spreadsheet_url(spreadsheet_id),
                 'sheets': [sheet.get('properties', {}).get('title', '') for sheet in result.get('sheets', [])]
             }
-            
-        except HttpError as e:
-            logger.error(f"Failed to get spreadsheet info: {e}")
-            raise
+            with _spreadsheet_info_guard:
+                _spreadsheet_info_cache[spreadsheet_id] = info
+            return info
+
+
+@lru_cache(maxsize=1)
+def get_sheets_client() -> GoogleSheetsClient:
+    """Return the shared Google Sheets client, creating it on first use."""
+    return GoogleSheetsClient()
+
+
+async def warm_up_sheets_client() -> bool:
+    """Load Google credentials ahead of the first request."""
+    client = get_sheets_client()
+    
+    try:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, client.initialize)
+        return True
+    except Exception as e:
+        logger.warning(f"Google Sheets client not initialized at startup: {e}")
+        return False
+
+
+async def preload_existing_jobs(spreadsheet_id: str = None) -> int:
+    """Load the spreadsheet's job URLs into the duplicate cache without blocking the loop."""
+    client = get_sheets_client()
+    
+    try:
+        loop = asyncio.get_running_loop()
+        known_keys = await loop.run_in_executor(None, client._get_known_keys, spreadsheet_id)
+        return len(known_keys)
+    except Exception as e:
+        logger.error(f"Failed to preload existing jobs: {e}")
+        return 0
+
+
+async def _flush_pending_appends(spreadsheet_id: str):
+    """Write all buffered rows for a spreadsheet in one append."""
+    pending = _pending_appends.pop(spreadsheet_id, None)
+    if pending is None:
+        return
+    if pending.timer is not None:
+        pending.timer.cancel()
+    
+    # Drop URLs already queued by an earlier caller in the same flush
+    combined_jobs = []
+    counts = []
+    batch_keys = set()
+    for jobs, filter_duplicates, _ in pending.entries:
+        if filter_duplicates:
+            jobs = [job for job in jobs if not job.get('job_url') or job_key(job['job_url']) not in batch_keys]
+        batch_keys.update(job_key(job['job_url']) for job in jobs if job.get('job_url'))
+        combined_jobs.extend(jobs)
+        counts.append(len(jobs))
+    
+    _appending.add(spreadsheet_id)
+    try:
+        client = get_sheets_client()
+        loop = asyncio.get_running_loop()
+        if combined_jobs:
+            await loop.run_in_executor(None, client.add_jobs, combined_jobs, spreadsheet_id)
+    except Exception as e:
+        for _, _, future in pending.entries:
+            if not future.done():
+                future.set_exception(e)
+        return
+    except BaseException:
+        # Cancelled (e.g. at shutdown); callers waiting on these rows must not hang
+        for _, _, future in pending.entries:
+            if not future.done():
+                future.set_exception(RuntimeError("Append was cancelled before the rows were written"))
+        raise
+    finally:
+        _appending.discard(spreadsheet_id)
+        # Rows buffered while this append ran go out together right away
+        if spreadsheet_id in _pending_appends:
+            _schedule_flush(spreadsheet_id)
+    
+    for (_, _, future), count in zip(pending.entries, counts):
+        if not future.done():
+            future.set_result(count)
+
+
+def _schedule_flush(spreadsheet_id: str):
+    """Start a flush task for a spreadsheet's buffered rows."""
+    task = asyncio.ensure_future(_flush_pending_appends(spreadsheet_id))
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def _buffer_jobs(jobs: List[Dict[str, Any]], spreadsheet_id: str,
+                       filter_duplicates: bool) -> int:
+    """Queue jobs for a combined append and wait until they are written."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    pending = _pending_appends.setdefault(spreadsheet_id, _PendingAppend())
+    pending.entries.append((jobs, filter_duplicates, future))
+    pending.row_count += len(jobs)
+    
+    if spreadsheet_id not in _appending or pending.row_count >= config.sheets_flush_max_rows:
+        # Nothing to wait for, or enough rows for one append
+        _schedule_flush(spreadsheet_id)
+    elif pending.timer is None:
+        # Bounded from the first buffered rows, so steady appends cannot hold them back
+        pending.timer = loop.call_later(
+            config.sheets_flush_delay_seconds, _schedule_flush, spreadsheet_id
+        )
+    
+    return await future
+
+
+async def flush_all_pending_appends():
+    """Write out every buffered append, e.g. before shutdown."""
+    for spreadsheet_id in list(_pending_appends):
+        await _flush_pending_appends(spreadsheet_id)
 
 
 async def add_jobs_to_sheets(jobs: List[Dict[str, Any]], spreadsheet_id: str = None, 
                            filter_duplicates: bool = True) -> Dict[str, Any]:
     """High-level function to add jobs to Google Sheets."""
-    client = GoogleSheetsClient(spreadsheet_id)
+    client = get_sheets_client()
+    spreadsheet_id = spreadsheet_id or client.spreadsheet_id
     
     try:
-        client.initialize()
+        # The Sheets API client blocks, so its calls run on the default executor
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, client.initialize)
         
         if filter_duplicates:
-            jobs = client.filter_new_jobs(jobs, spreadsheet_id)
+            jobs = await loop.run_in_executor(None, client.filter_new_jobs, jobs, spreadsheet_id)
         
         if not jobs:
             return {
@@ -326,13 +586,15 @@ async def add_jobs_to_sheets(jobs: List[Dict[str, Any]], spreadsheet_id: str = N
                 'message': 'No new jobs to add'
             }
         
-        jobs_added = client.add_jobs(jobs, spreadsheet_id)
-        spreadsheet_info = client.get_spreadsheet_info(spreadsheet_id)
+        if not spreadsheet_id:
+            raise ValueError("No spreadsheet ID provided")
+        
+        jobs_added = await _buffer_jobs(jobs, spreadsheet_id, filter_duplicates)
         
         return {
             'success': True,
             'jobs_added': jobs_added,
-            'spreadsheet_url': spreadsheet_info['url'],
+            'spreadsheet_url': spreadsheet_url(spreadsheet_id),
             'message': f'Successfully added {jobs_added} jobs to spreadsheet'
         }
         
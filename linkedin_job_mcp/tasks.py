@@ -0,0 +1,228 @@
+"""Background job search tasks, run on Celery when Redis is configured."""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+from .linkedin_scraper import close_http_client, driver_pool, search_linkedin_jobs
+from .sheets_client import add_jobs_to_sheets, flush_all_pending_appends
+from .config import config
+
+# Only imported when Redis is configured; they are slow imports that are otherwise unused
+Celery = None
+AsyncResult = None
+worker_process_shutdown = None
+aioredis = None
+if config.redis_url:
+    try:
+        from celery import Celery
+        from celery.result import AsyncResult
+        from celery.signals import worker_process_shutdown
+    except ImportError:
+        pass
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        pass
+
+logger = logging.getLogger(__name__)
+
+
+async def run_job_search(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a job search and optionally add the results to Google Sheets."""
+    jobs = await search_linkedin_jobs(
+        keywords=request_data["keywords"],
+        location=request_data.get("location", ""),
+        requirements=request_data.get("requirements", []),
+        max_jobs=request_data.get("max_jobs"),
+        experience_level=request_data.get("experience_level", ""),
+        employment_type=request_data.get("employment_type", ""),
+        date_posted=request_data.get("date_posted", "")
+    )
+
+    matching_jobs = sum(1 for job in jobs if job.get('is_match', True))
+    jobs_added_to_sheets = None
+    spreadsheet_url = None
+
+    # Add to Google Sheets if spreadsheet_id is provided
+    if request_data.get("spreadsheet_id"):
+        sheets_result = await add_jobs_to_sheets(
+            jobs=jobs,
+            spreadsheet_id=request_data["spreadsheet_id"],
+            filter_duplicates=request_data.get("filter_duplicates", True)
+        )
+
+        if sheets_result["success"]:
+            jobs_added_to_sheets = sheets_result["jobs_added"]
+            spreadsheet_url = sheets_result.get("spreadsheet_url")
+
+    return {
+        "jobs_found": len(jobs),
+        "matching_jobs": matching_jobs,
+        "jobs_added_to_sheets": jobs_added_to_sheets,
+        "spreadsheet_url": spreadsheet_url,
+        "jobs": jobs
+    }
+
+
+# Event loop shared by all tasks run in a Celery worker process
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_in_worker_loop(coro):
+    """Run a coroutine on this worker process's event loop."""
+    # The driver pool, search semaphore and HTTP client bind to the loop they are first
+    # used on, so tasks share one long-lived loop instead of calling asyncio.run() each time
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+async def _close_worker_resources():
+    """Release the browsers, HTTP connections and buffered rows of a worker process."""
+    await flush_all_pending_appends()
+    await close_http_client()
+    await driver_pool.close()
+
+
+celery_app = None
+search_jobs_task = None
+
+if Celery is not None and config.redis_url:
+    celery_app = Celery("linkedin_jobs", broker=config.redis_url, backend=config.redis_url)
+    celery_app.conf.update(
+        task_track_started=True,
+        task_serializer="json",
+        result_serializer="json",
+        accept_content=["json"],
+        # Selenium searches go to their own queue so workers running Chrome can be sized separately
+        task_routes={"linkedin_jobs.search_jobs": {"queue": config.celery_search_queue}},
+        worker_prefetch_multiplier=1,
+        task_acks_late=True
+    )
+
+    @celery_app.task(bind=True, name="linkedin_jobs.search_jobs")
+    def search_jobs_task(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Celery task wrapping run_job_search."""
+        logger.info(f"Running background job search {self.request.id}: {request_data.get('keywords')}")
+        return _run_in_worker_loop(run_job_search(request_data))
+    
+    @worker_process_shutdown.connect
+    def _shutdown_worker_process(**kwargs):
+        if _worker_loop is not None and not _worker_loop.is_closed():
+            _worker_loop.run_until_complete(_close_worker_resources())
+            _worker_loop.close()
+
+
+# Celery task states mapped onto the statuses reported by /search/status. PENDING is left
+# out: Celery reports it for unknown ids too, so queued tasks are looked up in the task store.
+_CELERY_STATUSES = {
+    "RECEIVED": "started",
+    "STARTED": "running",
+    "RETRY": "running",
+    "SUCCESS": "completed",
+    "FAILURE": "failed",
+    "REVOKED": "failed"
+}
+
+
+def get_celery_task_status(task_id: str) -> Optional[Dict[str, Any]]:
+    """Get the status of a Celery search task.
+    
+    Returns None if Celery is not in use or the task is PENDING, i.e. not picked up yet
+    or unknown. Makes blocking calls to the result backend.
+    """
+    if celery_app is None:
+        return None
+
+    result = AsyncResult(task_id, app=celery_app)
+    if result.state == "PENDING":
+        return None
+    status = {
+        "status": _CELERY_STATUSES.get(result.state, result.state.lower()),
+        "timestamp": result.date_done.isoformat() if result.date_done else None
+    }
+
+    if result.successful():
+        status["result"] = result.result
+    elif result.failed():
+        status["error"] = str(result.result)
+
+    return status
+
+
+class InMemoryTaskStore:
+    """Task status store for a single API process; entries expire after a TTL."""
+    
+    # Bound on kept statuses; the oldest are dropped first once it is reached
+    MAX_TASKS = 1000
+    
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._tasks: TTLCache = TTLCache(maxsize=self.MAX_TASKS, ttl=ttl_seconds)
+    
+    async def create(self, task_id: str, state: Dict[str, Any]):
+        """Store the initial state of a task."""
+        self._tasks[task_id] = dict(state)
+    
+    async def update(self, task_id: str, **fields: Any):
+        """Update some fields of a task's state."""
+        state = self._tasks.get(task_id)
+        if state is not None:
+            state.update(fields)
+            # Setting the entry again restarts its TTL
+            self._tasks[task_id] = state
+    
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task's state, or None if it is unknown or expired."""
+        return self._tasks.get(task_id)
+    
+    async def close(self):
+        """Nothing to release for the in-memory store."""
+
+
+class RedisTaskStore:
+    """Task status store shared by all API workers, kept as one Redis hash per task."""
+
+    def __init__(self, redis_url: str, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._redis = aioredis.Redis.from_url(redis_url)
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f"task:{task_id}"
+
+    async def create(self, task_id: str, state: Dict[str, Any]):
+        """Store the initial state of a task."""
+        await self.update(task_id, **state)
+
+    async def update(self, task_id: str, **fields: Any):
+        """Update some fields of a task's state without resending the rest."""
+        key = self._key(task_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={name: json.dumps(value) for name, value in fields.items()})
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task's state, or None if it is unknown or expired."""
+        fields = await self._redis.hgetall(self._key(task_id))
+        if not fields:
+            return None
+        return {name.decode(): json.loads(value) for name, value in fields.items()}
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+def create_task_store():
+    """Create the task status store: Redis when configured, otherwise in-memory."""
+    if aioredis is not None and config.redis_url:
+        return RedisTaskStore(config.redis_url, config.task_status_ttl_seconds)
+    return InMemoryTaskStore(config.task_status_ttl_seconds)
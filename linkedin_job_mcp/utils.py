@@ -3,10 +3,16 @@
 import logging
 import sys
 from typing import Any, Dict, List, Optional
-from functools import wraps
+from functools import lru_cache, wraps
 import asyncio
 from datetime import datetime
 import re
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
@@ -159,6 +165,41 @@ def validate_spreadsheet_id(spreadsheet_id: str) -> bool:
     return bool(re.match(pattern, spreadsheet_id))
 
 
+_JOB_ID_PATTERN = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+
+
+def job_key(job_url: str) -> str:
+    """Canonical key for a job URL, ignoring tracking parameters LinkedIn adds to links."""
+    match = _JOB_ID_PATTERN.search(job_url)
+    if match:
+        return match.group(1)
+    return job_url.split('#', 1)[0].split('?', 1)[0].rstrip('/')
+
+
+# LinkedIn job search filter values for the experience level, employment type and
+# date posted options, shared by the Selenium and fallback scrapers
+EXPERIENCE_LEVEL_FILTERS = MappingProxyType({
+    "internship": "1",
+    "entry": "2",
+    "associate": "3",
+    "mid": "4",
+    "director": "5",
+    "executive": "6"
+})
+EMPLOYMENT_TYPE_FILTERS = MappingProxyType({
+    "full-time": "F",
+    "part-time": "P",
+    "contract": "C",
+    "temporary": "T",
+    "internship": "I"
+})
+DATE_POSTED_FILTERS = MappingProxyType({
+    "past 24 hours": "r86400",
+    "past week": "r604800",
+    "past month": "r2592000"
+})
+
+
 def parse_job_requirements(requirements_text: str) -> List[str]:
     """Parse job requirements from text input."""
     if not requirements_text:
@@ -203,6 +244,126 @@ def calculate_match_score(job_text: str, requirements: List[str]) -> Dict[str, A
     }
 
 
+# Separators that shouldn't stop "REST API" from matching "REST-API" or "(REST API)".
+# Symbols that are part of skill names (C++, C#, .NET, Node.js) are kept.
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in ',;:!?()[]{}<>"\'/\\|_-'})
+
+
+def normalize_match_text(text: str) -> str:
+    """Lowercase text and collapse separators for requirement matching."""
+    return ' '.join(text.translate(_PUNCT_TABLE).lower().split())
+
+
+# Below this many distinct requirements one compiled regex beats building an automaton
+_AUTOMATON_MIN_REQUIREMENTS = 10
+
+
+class RequirementMatcher:
+    """Case-insensitive matcher for a fixed list of requirements.
+
+    Build it once per search and reuse it for every job. Small requirement
+    lists are compiled into a single regex alternation; larger ones use an
+    Aho-Corasick automaton when pyahocorasick is installed.
+    """
+    
+    def __init__(self, requirements: Optional[List[str]] = None):
+        self.requirements = list(requirements or [])
+        self._lowered = [normalize_match_text(requirement) for requirement in self.requirements]
+        self._automaton = None
+        self._pattern = None
+        self._group_indexes: List[List[int]] = []
+        self._contained: List[tuple] = []
+        
+        # Empty requirements match any text, as with a substring check
+        self._always = [index for index, needle in enumerate(self._lowered) if not needle]
+        
+        needle_indexes: Dict[str, List[int]] = {}
+        for index, needle in enumerate(self._lowered):
+            if needle:
+                needle_indexes.setdefault(needle, []).append(index)
+        
+        if not needle_indexes:
+            return
+        
+        if ahocorasick is not None and len(needle_indexes) >= _AUTOMATON_MIN_REQUIREMENTS:
+            automaton = ahocorasick.Automaton()
+            for needle, indexes in needle_indexes.items():
+                automaton.add_word(needle, indexes)
+            automaton.make_automaton()
+            self._automaton = automaton
+            return
+        
+        # A regex only reports one alternative per position, so needles that occur
+        # inside another needle are checked separately
+        alternatives = []
+        for needle, indexes in needle_indexes.items():
+            if any(needle != other and needle in other for other in needle_indexes):
+                self._contained.append((needle, indexes))
+            else:
+                alternatives.append(f"({re.escape(needle)})")
+                self._group_indexes.append(indexes)
+        
+        if alternatives:
+            # The lookahead lets matches overlap, e.g. "ab" and "bc" in "abc"
+            self._pattern = re.compile(f"(?=(?:{'|'.join(alternatives)}))")
+    
+    def find_matches(self, text: str) -> List[str]:
+        """Return the requirements found in text, in their original order."""
+        if not self.requirements:
+            return []
+        
+        text_lower = normalize_match_text(text)
+        found = set(self._always)
+        total = len(self.requirements)
+        
+        # Stop scanning as soon as every requirement has been seen
+        if self._automaton is not None:
+            for _, indexes in self._automaton.iter(text_lower):
+                found.update(indexes)
+                if len(found) == total:
+                    break
+        else:
+            if self._pattern is not None:
+                for match in self._pattern.finditer(text_lower):
+                    found.update(self._group_indexes[match.lastindex - 1])
+                    if len(found) == total:
+                        break
+            for needle, indexes in self._contained:
+                if needle in text_lower:
+                    found.update(indexes)
+        
+        return [self.requirements[index] for index in sorted(found)]
+    
+    def match(self, text: str) -> Dict[str, Any]:
+        """Calculate how well text matches the requirements."""
+        if not self.requirements:
+            return {
+                "matches": [],
+                "match_score": 1.0,
+                "is_match": True
+            }
+        
+        matches = self.find_matches(text)
+        match_score = len(matches) / len(self.requirements)
+        
+        return {
+            "matches": matches,
+            "match_score": match_score,
+            "is_match": match_score >= 0.5  # At least 50% match required
+        }
+
+
+@lru_cache(maxsize=128)
+def _cached_requirement_matcher(requirements: tuple) -> RequirementMatcher:
+    """Build a matcher for a tuple of requirements, reusing earlier builds."""
+    return RequirementMatcher(list(requirements))
+
+
+def get_requirement_matcher(requirements: Optional[List[str]] = None) -> RequirementMatcher:
+    """Return a shared matcher for the requirements; repeated searches skip the rebuild."""
+    return _cached_requirement_matcher(tuple(requirements or ()))
+
+
 def get_current_timestamp() -> str:
     """Get current timestamp in ISO format."""
     return datetime.now().isoformat()
@@ -218,7 +379,7 @@ class RateLimiter:
     
     async def acquire(self):
         """Acquire permission to make a call."""
-        now = asyncio.get_event_loop().time()
+        now = asyncio.get_running_loop().time()
         
         # Remove old calls outside the time window
         self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
@@ -256,13 +417,26 @@ def create_success_response(data: Any, message: str = "") -> Dict[str, Any]:
     }
 
 
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Common salary patterns, tried in order
+_SALARY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\$[\d,]+(?:\.\d{2})?\s*-\s*\$[\d,]+(?:\.\d{2})?',  # $50,000 - $70,000
+        r'\$[\d,]+(?:\.\d{2})?(?:\s*-\s*[\d,]+)?[kK]?',      # $50k, $50,000
+        r'[\d,]+[kK]\s*-\s*[\d,]+[kK]',                      # 50k - 70k
+        r'[\d,]+\s*-\s*[\d,]+\s*per\s+(?:year|hour)',        # 50000 - 70000 per year
+    )
+]
+
+
 def clean_text(text: str) -> str:
     """Clean and normalize text content."""
     if not text:
         return ""
     
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WHITESPACE_PATTERN.sub(' ', text.strip())
     
     # Remove common HTML entities
     text = text.replace('&nbsp;', ' ')
@@ -280,16 +454,8 @@ def extract_salary(text: str) -> str:
     if not text:
         return ""
     
-    # Common salary patterns
-    salary_patterns = [
-        r'\$[\d,]+(?:\.\d{2})?\s*-\s*\$[\d,]+(?:\.\d{2})?',  # $50,000 - $70,000
-        r'\$[\d,]+(?:\.\d{2})?(?:\s*-\s*[\d,]+)?[kK]?',      # $50k, $50,000
-        r'[\d,]+[kK]\s*-\s*[\d,]+[kK]',                      # 50k - 70k
-        r'[\d,]+\s*-\s*[\d,]+\s*per\s+(?:year|hour)',        # 50000 - 70000 per year
-    ]
-    
-    for pattern in salary_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _SALARY_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(0)
     
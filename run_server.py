@@ -17,6 +17,8 @@ def main():
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0)")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to (default: 8000)")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Number of worker processes (default: WEB_CONCURRENCY, or 1)")
     parser.add_argument("--log-level", default="info", choices=["debug", "info", "warning", "error"], 
                        help="Log level (default: info)")
     
@@ -32,7 +34,8 @@ def main():
         run_server(
             host=args.host,
             port=args.port,
-            reload=args.reload
+            reload=args.reload,
+            workers=args.workers
         )
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")